@@ -5,6 +5,7 @@ import (
 	"fmt"
 	"math"
 	"strconv"
+	"sync"
 	"time"
 
 	llmdVariantAutoscalingV1alpha1 "github.com/llm-d-incubation/workload-variant-autoscaler/api/v1alpha1"
@@ -210,33 +211,40 @@ func AddMetricsToOptStatus(ctx context.Context,
 
 	// --- 2. Execute Queries ---
 
-	arrivalVal, err := queryAndExtractMetric(ctx, promAPI, arrivalQuery, "ArrivalRate")
-	if err != nil {
-		return llmdVariantAutoscalingV1alpha1.Allocation{}, err
+	// queries are independent, run them concurrently rather than paying one round-trip after another
+	var arrivalVal, avgInputTokens, avgOutputTokens, ttftAverageTime, itlAverage float64
+	queries := []struct {
+		query      string
+		metricName string
+		result     *float64
+	}{
+		{arrivalQuery, "ArrivalRate", &arrivalVal},
+		{avgPromptToksQuery, "AvgInputTokens", &avgInputTokens},
+		{avgDecToksQuery, "AvgOutputTokens", &avgOutputTokens},
+		{ttftQuery, "TTFTAverageTime", &ttftAverageTime},
+		{itlQuery, "ITLAverage", &itlAverage},
 	}
-	arrivalVal *= 60 // convert from req/sec to req/min
-
-	avgInputTokens, err := queryAndExtractMetric(ctx, promAPI, avgPromptToksQuery, "AvgInputTokens")
-	if err != nil {
-		return llmdVariantAutoscalingV1alpha1.Allocation{}, err
+	errs := make([]error, len(queries))
+	var wg sync.WaitGroup
+	for i, q := range queries {
+		wg.Add(1)
+		go func(i int, query, metricName string, result *float64) {
+			defer wg.Done()
+			*result, errs[i] = queryAndExtractMetric(ctx, promAPI, query, metricName)
+		}(i, q.query, q.metricName, q.result)
 	}
+	wg.Wait()
 
-	avgOutputTokens, err := queryAndExtractMetric(ctx, promAPI, avgDecToksQuery, "AvgOutputTokens")
-	if err != nil {
-		return llmdVariantAutoscalingV1alpha1.Allocation{}, err
+	// report the first failing query, in query order
+	for _, err := range errs {
+		if err != nil {
+			return llmdVariantAutoscalingV1alpha1.Allocation{}, err
+		}
 	}
 
-	ttftAverageTime, err := queryAndExtractMetric(ctx, promAPI, ttftQuery, "TTFTAverageTime")
-	if err != nil {
-		return llmdVariantAutoscalingV1alpha1.Allocation{}, err
-	}
+	arrivalVal *= 60        // convert from req/sec to req/min
 	ttftAverageTime *= 1000 // convert to msec
-
-	itlAverage, err := queryAndExtractMetric(ctx, promAPI, itlQuery, "ITLAverage")
-	if err != nil {
-		return llmdVariantAutoscalingV1alpha1.Allocation{}, err
-	}
-	itlAverage *= 1000 // convert to msec
+	itlAverage *= 1000      // convert to msec
 
 	// --- 3. Collect K8s and Static Info ---
 
@@ -86,14 +86,10 @@ var _ = Describe("Collector", func() {
 			Expect(err).NotTo(HaveOccurred())
 			Expect(inventory).To(HaveLen(2))
 
-			Expect(inventory["gpu-node-1"]).To(HaveKey("A100"))
-			Expect(inventory["gpu-node-1"]["A100"].Count).To(Equal(4))
-			Expect(inventory["gpu-node-1"]["A100"].Memory).To(Equal("40Gi"))
+			Expect(inventory["gpu-node-1"]).To(HaveKeyWithValue("A100", AcceleratorModelInfo{Count: 4, Memory: "40Gi"}))
 
 			// Check gpu-node-2
-			Expect(inventory["gpu-node-2"]).To(HaveKey("MI300X"))
-			Expect(inventory["gpu-node-2"]["MI300X"].Count).To(Equal(2))
-			Expect(inventory["gpu-node-2"]["MI300X"].Memory).To(Equal("192Gi"))
+			Expect(inventory["gpu-node-2"]).To(HaveKeyWithValue("MI300X", AcceleratorModelInfo{Count: 2, Memory: "192Gi"}))
 		})
 
 		It("should handle nodes without GPU labels", func() {
@@ -174,10 +170,8 @@ var _ = Describe("Collector", func() {
 
 			Expect(err).NotTo(HaveOccurred())
 			Expect(inventory).To(HaveLen(2))
-			Expect(inventory["gpu-node-1"]["A100"].Count).To(Equal(0))
-			Expect(inventory["gpu-node-1"]["A100"].Memory).To(Equal("40Gi"))
-			Expect(inventory["gpu-node-2"]["MI300X"].Count).To(Equal(0))
-			Expect(inventory["gpu-node-2"]["MI300X"].Memory).To(Equal("192Gi"))
+			Expect(inventory["gpu-node-1"]).To(HaveKeyWithValue("A100", AcceleratorModelInfo{Count: 0, Memory: "40Gi"}))
+			Expect(inventory["gpu-node-2"]).To(HaveKeyWithValue("MI300X", AcceleratorModelInfo{Count: 0, Memory: "192Gi"}))
 		})
 
 		It("should handle multiple GPU types on same node", func() {
@@ -228,8 +222,7 @@ var _ = Describe("Collector", func() {
 			Expect(inventory["gpu-node-1"]["A100"].Count).To(Equal(2))
 			Expect(inventory["gpu-node-1"]["G2"].Count).To(Equal(1))
 			Expect(inventory["gpu-node-2"]).To(HaveLen(1))
-			Expect(inventory["gpu-node-2"]["MI300X"].Count).To(Equal(2))
-			Expect(inventory["gpu-node-2"]["MI300X"].Memory).To(Equal("192Gi"))
+			Expect(inventory["gpu-node-2"]).To(HaveKeyWithValue("MI300X", AcceleratorModelInfo{Count: 2, Memory: "192Gi"}))
 		})
 	})
 
@@ -21,8 +21,8 @@ import (
 	"encoding/json"
 	"fmt"
 	"os"
-	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	corev1 "k8s.io/api/core/v1"
@@ -49,6 +49,7 @@ import (
 	infernoSolver "github.com/llm-d-incubation/workload-variant-autoscaler/pkg/solver"
 	"github.com/prometheus/client_golang/api"
 	promv1 "github.com/prometheus/client_golang/api/prometheus/v1"
+	"go.uber.org/zap/zapcore"
 	appsv1 "k8s.io/api/apps/v1"
 	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
 	ctrl "sigs.k8s.io/controller-runtime"
@@ -61,6 +62,36 @@ type VariantAutoscalingReconciler struct {
 	Scheme *runtime.Scheme
 
 	PromAPI promv1.API
+
+	// actuator shared across reconciles, created on first use
+	actuatorOnce sync.Once
+	act          *actuator.Actuator
+
+	// queue sizing results of the previous optimization, reused by the next one
+	sizingsMu   sync.Mutex
+	prevSizings inferno.Sizings
+}
+
+// getActuator returns the reconciler's long-lived actuator
+func (r *VariantAutoscalingReconciler) getActuator() *actuator.Actuator {
+	r.actuatorOnce.Do(func() {
+		r.act = actuator.NewActuator(r.Client)
+	})
+	return r.act
+}
+
+// getPrevSizings returns the queue sizing results of the previous optimization
+func (r *VariantAutoscalingReconciler) getPrevSizings() inferno.Sizings {
+	r.sizingsMu.Lock()
+	defer r.sizingsMu.Unlock()
+	return r.prevSizings
+}
+
+// setPrevSizings keeps the queue sizing results of an optimization for the next one
+func (r *VariantAutoscalingReconciler) setPrevSizings(sizings inferno.Sizings) {
+	r.sizingsMu.Lock()
+	defer r.sizingsMu.Unlock()
+	r.prevSizings = sizings
 }
 
 // +kubebuilder:rbac:groups=llmd.ai,resources=variantautoscalings,verbs=get;list;watch;create;update;patch;delete
@@ -133,7 +164,7 @@ func (r *VariantAutoscalingReconciler) Reconcile(ctx context.Context, req ctrl.R
 	// WVA operates in unlimited mode - no cluster inventory collection needed
 	systemData := utils.CreateSystemData(acceleratorCm, serviceClassCm)
 
-	updateList, vaMap, allAnalyzerResponses, err := r.prepareVariantAutoscalings(ctx, activeVAs, acceleratorCm, serviceClassCm, systemData)
+	updateList, vaMap, allAnalyzerResponses, err := r.prepareVariantAutoscalings(ctx, activeVAs, systemData)
 	if err != nil {
 		logger.Log.Error(err, "failed to prepare variant autoscalings")
 		return ctrl.Result{}, err
@@ -141,6 +172,7 @@ func (r *VariantAutoscalingReconciler) Reconcile(ctx context.Context, req ctrl.R
 
 	// analyze
 	system := inferno.NewSystem()
+	system.ReuseSizings(r.getPrevSizings())
 	optimizerSpec := system.SetFromSpec(&systemData.Spec)
 	optimizer := infernoSolver.NewOptimizerFromSpec(optimizerSpec)
 	manager := infernoManager.NewManager(system, optimizer)
@@ -154,16 +186,20 @@ func (r *VariantAutoscalingReconciler) Reconcile(ctx context.Context, req ctrl.R
 		}
 		allAnalyzerResponses[s.Name()] = modelAnalyzeResponse
 	}
-	logger.Log.Debug("System data prepared for optimization: - ", utils.MarshalStructToJsonString(systemData.Spec.Capacity))
-	logger.Log.Debug("System data prepared for optimization: - ", utils.MarshalStructToJsonString(systemData.Spec.Accelerators))
-	logger.Log.Debug("System data prepared for optimization: - ", utils.MarshalStructToJsonString(systemData.Spec.ServiceClasses))
-	logger.Log.Debug("System data prepared for optimization: - ", utils.MarshalStructToJsonString(systemData.Spec.Models))
-	logger.Log.Debug("System data prepared for optimization: - ", utils.MarshalStructToJsonString(systemData.Spec.Optimizer))
-	logger.Log.Debug("System data prepared for optimization: - ", utils.MarshalStructToJsonString(systemData.Spec.Servers))
+	// marshal system data only when it is logged
+	if logger.Log.Level().Enabled(zapcore.DebugLevel) {
+		logger.Log.Debug("System data prepared for optimization: - ", utils.MarshalStructToJsonString(systemData.Spec.Capacity))
+		logger.Log.Debug("System data prepared for optimization: - ", utils.MarshalStructToJsonString(systemData.Spec.Accelerators))
+		logger.Log.Debug("System data prepared for optimization: - ", utils.MarshalStructToJsonString(systemData.Spec.ServiceClasses))
+		logger.Log.Debug("System data prepared for optimization: - ", utils.MarshalStructToJsonString(systemData.Spec.Models))
+		logger.Log.Debug("System data prepared for optimization: - ", utils.MarshalStructToJsonString(systemData.Spec.Optimizer))
+		logger.Log.Debug("System data prepared for optimization: - ", utils.MarshalStructToJsonString(systemData.Spec.Servers))
+	}
 
 	engine := variantAutoscalingOptimizer.NewVariantAutoscalingsEngine(manager, system)
 
 	optimizedAllocation, err := engine.Optimize(ctx, *updateList, allAnalyzerResponses)
+	r.setPrevSizings(system.Sizings())
 	if err != nil {
 		logger.Log.Error(err, "unable to perform model optimization, skipping this iteration")
 
@@ -218,14 +254,19 @@ func filterActiveVariantAutoscalings(items []llmdVariantAutoscalingV1alpha1.Vari
 func (r *VariantAutoscalingReconciler) prepareVariantAutoscalings(
 	ctx context.Context,
 	activeVAs []llmdVariantAutoscalingV1alpha1.VariantAutoscaling,
-	acceleratorCm map[string]map[string]string,
-	serviceClassCm map[string]string,
 	systemData *infernoConfig.SystemData,
 ) (*llmdVariantAutoscalingV1alpha1.VariantAutoscalingList, map[string]*llmdVariantAutoscalingV1alpha1.VariantAutoscaling, map[string]*interfaces.ModelAnalyzeResponse, error) {
 	var updateList llmdVariantAutoscalingV1alpha1.VariantAutoscalingList
 	allAnalyzerResponses := make(map[string]*interfaces.ModelAnalyzeResponse)
 	vaMap := make(map[string]*llmdVariantAutoscalingV1alpha1.VariantAutoscaling)
 
+	// index the service classes and accelerator costs already parsed into the system data once for all variants
+	sloIndex := utils.BuildModelSLOIndex(systemData.Spec.ServiceClasses.Spec)
+	acceleratorCosts := make(map[string]float64, len(systemData.Spec.Accelerators.Spec))
+	for _, acc := range systemData.Spec.Accelerators.Spec {
+		acceleratorCosts[acc.Name] = float64(acc.Cost)
+	}
+
 	for _, va := range activeVAs {
 		modelName := va.Spec.ModelID
 		if modelName == "" {
@@ -233,12 +274,14 @@ func (r *VariantAutoscalingReconciler) prepareVariantAutoscalings(
 			continue
 		}
 
-		entry, className, err := utils.FindModelSLO(serviceClassCm, modelName)
-		if err != nil {
+		slo, found := sloIndex[modelName]
+		if !found {
+			err := fmt.Errorf("model %q not found in any service class", modelName)
 			logger.Log.Error(err, "failed to locate SLO for model - ", "variantAutoscaling-name: ", va.Name, "modelName: ", modelName)
 			continue
 		}
-		logger.Log.Info("Found SLO for model - ", "model: ", modelName, ", class: ", className, ", slo-tpot: ", entry.SLOTPOT, ", slo-ttft: ", entry.SLOTTFT)
+		className := slo.ClassName
+		logger.Log.Info("Found SLO for model - ", "model: ", modelName, ", class: ", className, ", slo-tpot: ", slo.Entry.SLOTPOT, ", slo-ttft: ", slo.Entry.SLOTTFT)
 
 		for _, modelAcceleratorProfile := range va.Spec.ModelProfile.Accelerators {
 			if utils.AddModelAcceleratorProfileToSystemData(systemData, modelName, &modelAcceleratorProfile) != nil {
@@ -248,19 +291,15 @@ func (r *VariantAutoscalingReconciler) prepareVariantAutoscalings(
 		}
 
 		accName := va.Labels["inference.optimization/acceleratorName"]
-		acceleratorCostVal, ok := acceleratorCm[accName]["cost"]
+		acceleratorCostValFloat, ok := acceleratorCosts[accName]
 		if !ok {
+			// accelerators whose cost is absent or unparsable are left out of the system data
 			logger.Log.Error("variantAutoscaling missing accelerator cost in configMap, skipping optimization - ", "variantAutoscaling-name: ", va.Name)
 			continue
 		}
-		acceleratorCostValFloat, err := strconv.ParseFloat(acceleratorCostVal, 32)
-		if err != nil {
-			logger.Log.Error("variantAutoscaling unable to parse accelerator cost in configMap, skipping optimization - ", "variantAutoscaling-name: ", va.Name)
-			continue
-		}
 
 		var deploy appsv1.Deployment
-		err = utils.GetDeploymentWithBackoff(ctx, r.Client, va.Name, va.Namespace, &deploy)
+		err := utils.GetDeploymentWithBackoff(ctx, r.Client, va.Name, va.Namespace, &deploy)
 		if err != nil {
 			logger.Log.Error(err, "failed to get Deployment after retries - ", "variantAutoscaling-name: ", va.Name)
 			continue
@@ -378,10 +417,8 @@ func (r *VariantAutoscalingReconciler) applyOptimizedAllocations(
 				updateVa.Status.DesiredOptimizedAlloc.NumReplicas,
 				updateVa.Status.DesiredOptimizedAlloc.Accelerator))
 
-		act := actuator.NewActuator(r.Client)
-
 		// Emit optimization signals for external autoscalers
-		if err := act.EmitMetrics(ctx, &updateVa); err != nil {
+		if err := r.getActuator().EmitMetrics(ctx, &updateVa); err != nil {
 			logger.Log.Error(err, "failed to emit optimization signals for external autoscalers", "variant", updateVa.Name)
 		} else {
 			logger.Log.Info(fmt.Sprintf("Successfully emitted optimization signals for external autoscalers - variant: %s", updateVa.Name))
@@ -763,7 +763,7 @@ data:
 			systemData := utils.CreateSystemData(accMap, serviceClassMap)
 			Expect(systemData).NotTo(BeNil(), "System data should not be nil")
 
-			updateList, vaMap, allAnalyzerResponses, err := controllerReconciler.prepareVariantAutoscalings(ctx, activeVAs, accMap, serviceClassMap, systemData)
+			updateList, vaMap, allAnalyzerResponses, err := controllerReconciler.prepareVariantAutoscalings(ctx, activeVAs, systemData)
 
 			Expect(err).NotTo(HaveOccurred(), "prepareVariantAutoscalings should not return an error")
 			Expect(vaMap).NotTo(BeNil(), "VA map should not be nil")
@@ -814,7 +814,7 @@ data:
 			By("Preparing system data and calling prepareVariantAutoscalings")
 			systemData := utils.CreateSystemData(accMap, serviceClassMap)
 
-			_, _, _, err = controllerReconciler.prepareVariantAutoscalings(ctx, activeVAs, accMap, serviceClassMap, systemData)
+			_, _, _, err = controllerReconciler.prepareVariantAutoscalings(ctx, activeVAs, systemData)
 			Expect(err).NotTo(HaveOccurred())
 
 			By("Checking that MetricsAvailable condition is set to False")
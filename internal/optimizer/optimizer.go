@@ -10,6 +10,7 @@ import (
 	"github.com/llm-d-incubation/workload-variant-autoscaler/internal/utils"
 	inferno "github.com/llm-d-incubation/workload-variant-autoscaler/pkg/core"
 	infernoManager "github.com/llm-d-incubation/workload-variant-autoscaler/pkg/manager"
+	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
 )
 
 // Engine holding all necessary data to perform global optimization across all variants
@@ -42,11 +43,13 @@ func (engine *VariantAutoscalingsEngine) Optimize(ctx context.Context,
 
 	logger.Log.Debug("Optimization solution - ", "system: ", engine.system)
 
-	optimizedAllocMap := make(map[string]llmdOptv1alpha1.OptimizedAlloc)
+	// all allocations of this optimization run share the same run time
+	lastRunTime := metav1.Now()
+	optimizedAllocMap := make(map[string]llmdOptv1alpha1.OptimizedAlloc, len(vaList.Items))
 	for _, va := range vaList.Items {
 		vaName := va.Name
 		vaNamespace := va.Namespace
-		if optimizedAllocation, err := utils.CreateOptimizedAlloc(vaName, vaNamespace, allocationSolution); err == nil {
+		if optimizedAllocation, err := utils.CreateOptimizedAlloc(vaName, vaNamespace, allocationSolution, lastRunTime); err == nil {
 			optimizedAllocMap[vaName] = *optimizedAllocation
 		}
 	}
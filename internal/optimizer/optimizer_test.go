@@ -107,18 +107,8 @@ var _ = Describe("Optimizer", Ordered, func() {
 				},
 			}
 			Expect(client.IgnoreAlreadyExists(k8sClient.Create(ctx, ns))).NotTo(HaveOccurred())
-		})
 
-		AfterAll(func() {
-			ns = &corev1.Namespace{
-				ObjectMeta: metav1.ObjectMeta{
-					Name: configMapNamespace,
-				},
-			}
-			Expect(client.IgnoreNotFound(k8sClient.Delete(ctx, ns))).To(Succeed())
-		})
-
-		BeforeEach(func() {
+			// the configmaps are only read by the tests, create them once for all tests
 			By("creating the required configmap for optimization")
 			configMap := testutils.CreateServiceClassConfigMap(ns.Name)
 			Expect(k8sClient.Create(ctx, configMap)).To(Succeed())
@@ -139,7 +129,33 @@ var _ = Describe("Optimizer", Ordered, func() {
 			if wvaConfigCm["WVA_SCALE_TO_ZERO"] == "true" {
 				minNumReplicas = 0
 			}
+		})
+
+		AfterAll(func() {
+			cmAcc := &corev1.ConfigMap{}
+			err := utils.GetConfigMapWithBackoff(ctx, k8sClient, "accelerator-unit-costs", configMapNamespace, cmAcc)
+			Expect(err).NotTo(HaveOccurred(), "failed to get accelerator-unit-costs configmap")
+			Expect(client.IgnoreNotFound(k8sClient.Delete(ctx, cmAcc))).To(Succeed())
+
+			cmServClass := &corev1.ConfigMap{}
+			err = utils.GetConfigMapWithBackoff(ctx, k8sClient, "service-classes-config", configMapNamespace, cmServClass)
+			Expect(err).NotTo(HaveOccurred(), "failed to get service-class-config configmap")
+			Expect(client.IgnoreNotFound(k8sClient.Delete(ctx, cmServClass))).To(Succeed())
+
+			cmWvaClass := &corev1.ConfigMap{}
+			err = utils.GetConfigMapWithBackoff(ctx, k8sClient, configMapName, configMapNamespace, cmWvaClass)
+			Expect(err).NotTo(HaveOccurred(), "failed to get service-class-config configmap")
+			Expect(client.IgnoreNotFound(k8sClient.Delete(ctx, cmWvaClass))).To(Succeed())
+
+			ns = &corev1.Namespace{
+				ObjectMeta: metav1.ObjectMeta{
+					Name: configMapNamespace,
+				},
+			}
+			Expect(client.IgnoreNotFound(k8sClient.Delete(ctx, ns))).To(Succeed())
+		})
 
+		BeforeEach(func() {
 			// WVA operates in unlimited mode - no inventory data needed
 			systemData = utils.CreateSystemData(acceleratorCm, serviceClassCm)
 
@@ -214,21 +230,6 @@ var _ = Describe("Optimizer", Ordered, func() {
 		})
 
 		AfterEach(func() {
-			cmAcc := &corev1.ConfigMap{}
-			err := utils.GetConfigMapWithBackoff(ctx, k8sClient, "accelerator-unit-costs", configMapNamespace, cmAcc)
-			Expect(err).NotTo(HaveOccurred(), "failed to get accelerator-unit-costs configmap")
-			Expect(client.IgnoreNotFound(k8sClient.Delete(ctx, cmAcc))).To(Succeed())
-
-			cmServClass := &corev1.ConfigMap{}
-			err = utils.GetConfigMapWithBackoff(ctx, k8sClient, "service-classes-config", configMapNamespace, cmServClass)
-			Expect(err).NotTo(HaveOccurred(), "failed to get service-class-config configmap")
-			Expect(client.IgnoreNotFound(k8sClient.Delete(ctx, cmServClass))).To(Succeed())
-
-			cmWvaClass := &corev1.ConfigMap{}
-			err = utils.GetConfigMapWithBackoff(ctx, k8sClient, configMapName, configMapNamespace, cmWvaClass)
-			Expect(err).NotTo(HaveOccurred(), "failed to get service-class-config configmap")
-			Expect(client.IgnoreNotFound(k8sClient.Delete(ctx, cmWvaClass))).To(Succeed())
-
 			var variantAutoscalingList llmdVariantAutoscalingV1alpha1.VariantAutoscalingList
 			Expect(k8sClient.List(ctx, &variantAutoscalingList)).To(Succeed())
 			for _, va := range variantAutoscalingList.Items {
@@ -266,15 +267,17 @@ var _ = Describe("Optimizer", Ordered, func() {
 
 			// Prepare system data with all VariantAutoscalings info
 			By("Preparing system data with all VariantAutoscalings info")
+			sloIndex := utils.BuildModelSLOIndex(systemData.Spec.ServiceClasses.Spec)
 			for _, va := range activeVAs {
 				modelName := va.Spec.ModelID
 				Expect(modelName).NotTo(BeEmpty(), "variantAutoscaling missing modelName label, skipping optimization - ", "variantAutoscaling-name: ", va.Name)
 
-				_, className, err := utils.FindModelSLO(serviceClassCm, modelName)
-				Expect(err).NotTo(HaveOccurred(), "failed to find model SLO for model - ", modelName, ", variantAutoscaling - ", va.Name)
+				slo, found := sloIndex[modelName]
+				Expect(found).To(BeTrue(), "failed to find model SLO for model - ", modelName, ", variantAutoscaling - ", va.Name)
+				className := slo.ClassName
 
 				for _, modelAcceleratorProfile := range va.Spec.ModelProfile.Accelerators {
-					err = utils.AddModelAcceleratorProfileToSystemData(systemData, modelName, &modelAcceleratorProfile)
+					err := utils.AddModelAcceleratorProfileToSystemData(systemData, modelName, &modelAcceleratorProfile)
 					Expect(err).NotTo(HaveOccurred(), "failed to add model accelerator profile to system data for model - ", modelName, ", variantAutoscaling - ", va.Name)
 				}
 
@@ -364,15 +367,17 @@ var _ = Describe("Optimizer", Ordered, func() {
 
 			// Prepare system data with all VariantAutoscalings info
 			By("Preparing system data with all VariantAutoscalings info")
+			sloIndex := utils.BuildModelSLOIndex(systemData.Spec.ServiceClasses.Spec)
 			for _, va := range activeVAs {
 				modelName := va.Spec.ModelID
 				Expect(modelName).NotTo(BeEmpty(), "variantAutoscaling missing modelName label, skipping optimization - ", "variantAutoscaling-name: ", va.Name)
 
-				_, className, err := utils.FindModelSLO(serviceClassCm, modelName)
-				Expect(err).NotTo(HaveOccurred(), "failed to find model SLO for model - ", modelName, ", variantAutoscaling - ", va.Name)
+				slo, found := sloIndex[modelName]
+				Expect(found).To(BeTrue(), "failed to find model SLO for model - ", modelName, ", variantAutoscaling - ", va.Name)
+				className := slo.ClassName
 
 				for _, modelAcceleratorProfile := range va.Spec.ModelProfile.Accelerators {
-					err = utils.AddModelAcceleratorProfileToSystemData(systemData, modelName, &modelAcceleratorProfile)
+					err := utils.AddModelAcceleratorProfileToSystemData(systemData, modelName, &modelAcceleratorProfile)
 					Expect(err).NotTo(HaveOccurred(), "failed to add model accelerator profile to system data for model - ", modelName, ", variantAutoscaling - ", va.Name)
 				}
 
@@ -1,12 +1,12 @@
 package utils
 
 import (
+	"bytes"
 	"context"
 	"encoding/json"
 	"fmt"
 	"math"
 	"os"
-	"regexp"
 	"strconv"
 	"strings"
 	"time"
@@ -251,7 +251,7 @@ func AddServerInfoToSystemData(
 		avgInputTokens = 0
 	}
 
-	serverLoadSpec := &infernoConfig.ServerLoadSpec{
+	serverLoadSpec := infernoConfig.ServerLoadSpec{
 		ArrivalRate:  float32(arrivalRate),
 		AvgInTokens:  int(avgInputTokens),
 		AvgOutTokens: int(avgOutputTokens),
@@ -268,14 +268,14 @@ func AddServerInfoToSystemData(
 		ttftAverage = 0
 	}
 
-	AllocationData := &infernoConfig.AllocationData{
+	allocationData := infernoConfig.AllocationData{
 		Accelerator: va.Status.CurrentAlloc.Accelerator,
 		NumReplicas: va.Status.CurrentAlloc.NumReplicas,
 		MaxBatch:    va.Status.CurrentAlloc.MaxBatch,
 		Cost:        float32(cost),
 		ITLAverage:  float32(itlAverage),
 		TTFTAverage: float32(ttftAverage),
-		Load:        *serverLoadSpec,
+		Load:        serverLoadSpec,
 	}
 
 	// all server data
@@ -283,13 +283,13 @@ func AddServerInfoToSystemData(
 	if os.Getenv("WVA_SCALE_TO_ZERO") == "true" {
 		minNumReplicas = 0
 	}
-	serverSpec := &infernoConfig.ServerSpec{
+	serverSpec := infernoConfig.ServerSpec{
 		Name:            FullName(va.Name, va.Namespace),
 		Class:           className,
 		Model:           va.Spec.ModelID,
 		KeepAccelerator: true,
 		MinNumReplicas:  minNumReplicas,
-		CurrentAlloc:    *AllocationData,
+		CurrentAlloc:    allocationData,
 		DesiredAlloc:    infernoConfig.AllocationData{},
 	}
 
@@ -306,14 +306,15 @@ func AddServerInfoToSystemData(
 		serverSpec.MaxBatchSize = maxBatchSize
 	}
 
-	sd.Spec.Servers.Spec = append(sd.Spec.Servers.Spec, *serverSpec)
+	sd.Spec.Servers.Spec = append(sd.Spec.Servers.Spec, serverSpec)
 	return nil
 }
 
 // Adapter from inferno alloc solution to optimized alloc
 func CreateOptimizedAlloc(name string,
 	namespace string,
-	allocationSolution *infernoConfig.AllocationSolution) (*llmdVariantAutoscalingV1alpha1.OptimizedAlloc, error) {
+	allocationSolution *infernoConfig.AllocationSolution,
+	lastRunTime metav1.Time) (*llmdVariantAutoscalingV1alpha1.OptimizedAlloc, error) {
 
 	serverName := FullName(name, namespace)
 	var allocationData infernoConfig.AllocationData
@@ -323,7 +324,7 @@ func CreateOptimizedAlloc(name string,
 	}
 	logger.Log.Debug("Setting accelerator name ", "Name ", allocationData.Accelerator, "allocationData ", allocationData)
 	optimizedAlloc := &llmdVariantAutoscalingV1alpha1.OptimizedAlloc{
-		LastRunTime: metav1.NewTime(time.Now()),
+		LastRunTime: lastRunTime,
 		Accelerator: allocationData.Accelerator,
 		NumReplicas: allocationData.NumReplicas,
 	}
@@ -356,30 +357,41 @@ func GetZapLevelFromEnv() zapcore.Level {
 	}
 }
 
+// Helper to render a struct as a compact, single-line JSON string (quotes removed) for logging
 func MarshalStructToJsonString(t any) string {
-	jsonBytes, err := json.MarshalIndent(t, "", " ")
+	jsonBytes, err := json.Marshal(t)
 	if err != nil {
 		return fmt.Sprintf("error marshalling: %v", err)
 	}
-	re := regexp.MustCompile("\"|\n")
-	return re.ReplaceAllString(string(jsonBytes), "")
+	// compact JSON has no newlines, only quotes need to be removed
+	return string(bytes.ReplaceAll(jsonBytes, []byte{'"'}, nil))
 }
 
-// Helper to find SLOs for a model variant
-func FindModelSLO(cmData map[string]string, targetModel string) (*interfaces.ServiceClassEntry, string /* class name */, error) {
-	for key, val := range cmData {
-		var sc interfaces.ServiceClass
-		if err := yaml.Unmarshal([]byte(val), &sc); err != nil {
-			return nil, "", fmt.Errorf("failed to parse %s: %w", key, err)
-		}
+// SLO entry of a model together with the name of its service class
+type ModelSLO struct {
+	Entry     interfaces.ServiceClassEntry
+	ClassName string
+}
 
-		for _, entry := range sc.Data {
-			if entry.Model == targetModel {
-				return &entry, sc.Name, nil
+// Helper to index SLOs by model name from the service classes already parsed into
+// the system data (the first service class found for a model wins)
+func BuildModelSLOIndex(serviceClasses []infernoConfig.ServiceClassSpec) map[string]ModelSLO {
+	index := make(map[string]ModelSLO)
+	for _, sc := range serviceClasses {
+		for _, target := range sc.ModelTargets {
+			if _, exists := index[target.Model]; !exists {
+				index[target.Model] = ModelSLO{
+					Entry: interfaces.ServiceClassEntry{
+						Model:   target.Model,
+						SLOTPOT: int(target.SLO_ITL),
+						SLOTTFT: int(target.SLO_TTFT),
+					},
+					ClassName: sc.Name,
+				}
 			}
 		}
 	}
-	return nil, "", fmt.Errorf("model %q not found in any service class", targetModel)
+	return index
 }
 
 func Ptr[T any](v T) *T {
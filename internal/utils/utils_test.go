@@ -0,0 +1,66 @@
+package utils
+
+import (
+	. "github.com/onsi/ginkgo/v2"
+	. "github.com/onsi/gomega"
+
+	interfaces "github.com/llm-d-incubation/workload-variant-autoscaler/internal/interfaces"
+	infernoConfig "github.com/llm-d-incubation/workload-variant-autoscaler/pkg/config"
+)
+
+var _ = Describe("BuildModelSLOIndex", func() {
+	It("should index a model listed in two classes under the first class", func() {
+		serviceClasses := []infernoConfig.ServiceClassSpec{
+			{
+				Name:     "premium",
+				Priority: 1,
+				ModelTargets: []infernoConfig.ModelTarget{
+					{Model: "meta/llama0-70b", SLO_ITL: 24, SLO_TTFT: 500},
+				},
+			},
+			{
+				Name:     "freemium",
+				Priority: 10,
+				ModelTargets: []infernoConfig.ModelTarget{
+					{Model: "meta/llama0-70b", SLO_ITL: 200, SLO_TTFT: 2000},
+					{Model: "ibm/granite-13b", SLO_ITL: 80, SLO_TTFT: 1000},
+				},
+			},
+		}
+
+		index := BuildModelSLOIndex(serviceClasses)
+
+		Expect(index).To(HaveLen(2))
+		Expect(index).To(HaveKeyWithValue("meta/llama0-70b", ModelSLO{
+			Entry:     interfaces.ServiceClassEntry{Model: "meta/llama0-70b", SLOTPOT: 24, SLOTTFT: 500},
+			ClassName: "premium",
+		}))
+		Expect(index).To(HaveKeyWithValue("ibm/granite-13b", ModelSLO{
+			Entry:     interfaces.ServiceClassEntry{Model: "ibm/granite-13b", SLOTPOT: 80, SLOTTFT: 1000},
+			ClassName: "freemium",
+		}))
+	})
+
+	It("should not index a model missing from all classes", func() {
+		serviceClasses := []infernoConfig.ServiceClassSpec{
+			{
+				Name:     "premium",
+				Priority: 1,
+				ModelTargets: []infernoConfig.ModelTarget{
+					{Model: "meta/llama0-70b", SLO_ITL: 24, SLO_TTFT: 500},
+				},
+			},
+		}
+
+		index := BuildModelSLOIndex(serviceClasses)
+
+		Expect(index).NotTo(HaveKey("ibm/granite-13b"))
+	})
+
+	It("should return an empty index for an empty spec", func() {
+		index := BuildModelSLOIndex(nil)
+
+		Expect(index).NotTo(BeNil())
+		Expect(index).To(BeEmpty())
+	})
+})
@@ -63,9 +63,11 @@ func (m *MM1KModel) computeProbabilities() {
 		m.p[0] = (1 - float64(m.rho)) / (1 - math.Pow(float64(m.rho), float64(m.K+1)))
 	}
 	// Compute p[i], i=1,2, ..., K
-	m.sumP = 0
-	for i := 0; i <= m.K; i++ {
-		m.p[i] = m.p[0] * math.Pow(float64(m.rho), float64(i))
+	//   - p[i] = p[0] * rho^i, accumulated as a running product
+	rho := float64(m.rho)
+	m.sumP = m.p[0]
+	for i := 1; i <= m.K; i++ {
+		m.p[i] = m.p[i-1] * rho
 		m.sumP += m.p[i]
 	}
 }
@@ -8,16 +8,20 @@ import (
 // M/M/1 model with state dependent service rate
 type MM1ModelStateDependent struct {
 	MM1KModel                 // extends base class
-	servRate        []float32 // state-dependent service rate
+	servRate        []float64 // state-dependent service rate
 	avgNumInServers float32
 }
 
 func NewMM1ModelStateDependent(K int, servRate []float32) *MM1ModelStateDependent {
 	m := MM1ModelStateDependent{
 		MM1KModel:       *NewMM1KModel(K),
-		servRate:        servRate,
+		servRate:        make([]float64, len(servRate)),
 		avgNumInServers: 0,
 	}
+	// kept in the precision of the probability computation, converted once
+	for i, rate := range servRate {
+		m.servRate[i] = float64(rate)
+	}
 
 	m.QueueModel.ComputeRho = m.ComputeRho
 	m.QueueModel.computeStatistics = m.computeStatistics
@@ -25,8 +29,18 @@ func NewMM1ModelStateDependent(K int, servRate []float32) *MM1ModelStateDependen
 }
 
 // Solve queueing model given arrival and service rates
+//   - same steps as QueueModel.Solve, calling the methods of this model directly
+//     rather than through the function fields of the base class
 func (m *MM1ModelStateDependent) Solve(lambda float32, mu float32) {
-	m.MM1KModel.Solve(lambda, mu)
+	m.lambda = lambda
+	m.mu = mu
+	m.rho = m.ComputeRho()
+	if (m.rho < 0) || (m.rho >= m.GetRhoMax()) || (lambda < 0) || (mu <= 0) {
+		m.isValid = false
+	} else {
+		m.isValid = true
+		m.computeStatistics()
+	}
 }
 
 // Compute utilization of queueing model
@@ -42,16 +56,21 @@ func (m *MM1ModelStateDependent) computeStatistics() {
 	m.computeProbabilities()
 
 	// calculate avgNumInServers
+	//   - states up to num have all requests in service, states beyond have num requests in service
 	num := len(m.servRate)
 	var avgNumInServers float64
 	var avgNumInSystem float64
 	sumP := m.p[0]
-	for i := 1; i <= m.K; i++ {
+	numServ := min(num, m.K)
+	for i := 1; i <= numServ; i++ {
 		avgNumInSystem += float64(i) * m.p[i]
 		sumP += m.p[i]
-		if i == num {
-			avgNumInServers = avgNumInSystem + (1-sumP)*float64(num)
-		}
+	}
+	if num <= m.K {
+		avgNumInServers = avgNumInSystem + (1-sumP)*float64(num)
+	}
+	for i := numServ + 1; i <= m.K; i++ {
+		avgNumInSystem += float64(i) * m.p[i]
 	}
 	m.avgNumInServers = float32(avgNumInServers)
 	m.avgNumInSystem = float32(avgNumInSystem)
@@ -68,39 +87,24 @@ func (m *MM1ModelStateDependent) computeStatistics() {
 
 // Compute state probabilities
 func (m *MM1ModelStateDependent) computeProbabilities() {
-	// queue length distribution
+	// queue length distribution (unnormalized), accumulating its sum in the same pass
 	// p[i] = Probability[system has exactly i customers]
 	m.p[0] = 1
+	sum := m.p[0]
 	scale := math.MaxFloat64 / float64(m.K)
-	var sRate float64
+	lambda := float64(m.lambda)
 	num := len(m.servRate)
 	for n := 0; n < m.K; n++ {
-		if n < num {
-			sRate = float64(m.servRate[n])
-		} else {
-			sRate = float64(m.servRate[num-1])
-		}
-		m.p[n+1] = m.p[n] * float64(m.lambda) / sRate
+		// service rate saturates at the max batch size
+		sRate := m.servRate[min(n, num-1)]
+		m.p[n+1] = m.p[n] * lambda / sRate
 		for m.p[n+1] < 0 || math.IsInf(m.p[n+1], 0) || math.IsNaN(m.p[n+1]) {
-			for i := 0; i <= n; i++ {
-				m.p[i] /= scale
-			}
-			m.p[n+1] = m.p[n] * float64(m.lambda) / sRate
+			sum = m.rescale(n, scale)
+			m.p[n+1] = m.p[n] * lambda / sRate
 		}
-	}
-
-	// normalize queue length distribution
-	var sum float64
-	for n := 0; n <= m.K; n++ {
-		sum += m.p[n]
+		sum += m.p[n+1]
 		if sum < 0 || math.IsInf(sum, 0) {
-			sum = 0
-			for i := 0; i <= m.K; i++ {
-				m.p[i] /= scale
-				if i <= n {
-					sum += m.p[i]
-				}
-			}
+			sum = m.rescale(n+1, scale)
 		}
 	}
 
@@ -115,6 +119,15 @@ func (m *MM1ModelStateDependent) computeProbabilities() {
 	m.rho = m.ComputeRho()
 }
 
+// Scale down probabilities p[0], ..., p[n] to avoid overflow, returns their sum
+func (m *MM1ModelStateDependent) rescale(n int, scale float64) (sum float64) {
+	for i := 0; i <= n; i++ {
+		m.p[i] /= scale
+		sum += m.p[i]
+	}
+	return sum
+}
+
 func (m *MM1ModelStateDependent) GetAvgNumInServers() float32 {
 	return m.avgNumInServers
 }
@@ -18,6 +18,30 @@ type QueueAnalyzer struct {
 	RequestSize  *RequestSize            // number of input and output tokens per request
 	Model        *MM1ModelStateDependent // queueing model
 	RateRange    *RateRange              // range of request rates for model stability
+
+	effConc effConcParms // precomputed terms of the effective concurrency calculation
+}
+
+// terms of the effective concurrency calculation which depend only on service parameters and request size
+//   - n = (avgServiceTime - base) / slope
+type effConcParms struct {
+	base  float32 // gamma + alpha * (outTokens - 1)
+	slope float32 // delta * inTokens + beta * (outTokens - 1)
+}
+
+func newEffConcParms(serviceParms *ServiceParms, requestSize *RequestSize) effConcParms {
+	tokens := float32(requestSize.AvgOutputTokens - 1)
+	return effConcParms{
+		base:  serviceParms.Prefill.Gamma + serviceParms.Decode.Alpha*tokens,
+		slope: (serviceParms.Prefill.Delta * float32(requestSize.AvgInputTokens)) + (serviceParms.Decode.Beta * tokens),
+	}
+}
+
+// calculate effective average number of requests in service, given average request service time,
+// bounded by the max batch size
+func (p effConcParms) eval(avgServiceTime float32, maxBatchSize int) float32 {
+	n := (avgServiceTime - p.base) / p.slope
+	return min(max(n, 0), float32(maxBatchSize))
 }
 
 // queue configuration parameters
@@ -99,17 +123,21 @@ func NewQueueAnalyzer(qConfig *Configuration, requestSize *RequestSize) (*QueueA
 func BuildModel(qConfig *Configuration, requestSize *RequestSize) (modelData *QueueAnalyzer) {
 	parms := qConfig.ServiceParms
 
+	// number of decodes (one per output token except the first), independent of batch size
+	numDecode := requestSize.AvgOutputTokens - 1
+	// special case: allow one decode in case of decode only and one output token
+	if requestSize.AvgInputTokens == 0 && requestSize.AvgOutputTokens == 1 {
+		numDecode = 1
+	}
+	decodeFactor := float32(numDecode)
+
 	// calculate state-dependent service rate
 	servRate := make([]float32, qConfig.MaxBatchSize)
 	for n := 1; n <= qConfig.MaxBatchSize; n++ {
-		prefillTime := parms.Prefill.PrefillTime(requestSize.AvgInputTokens, float32(n))
-		numDecode := requestSize.AvgOutputTokens - 1 // number of decodes (one per output token except the first)
-		// special case: allow one decode in case of decode only and one output token
-		if requestSize.AvgInputTokens == 0 && requestSize.AvgOutputTokens == 1 {
-			numDecode = 1
-		}
-		decodeTime := float32(numDecode) * parms.Decode.DecodeTime(float32(n))
-		servRate[n-1] = float32(n) / (prefillTime + decodeTime)
+		batchSize := float32(n)
+		prefillTime := parms.Prefill.PrefillTime(requestSize.AvgInputTokens, batchSize)
+		decodeTime := decodeFactor * parms.Decode.DecodeTime(batchSize)
+		servRate[n-1] = batchSize / (prefillTime + decodeTime)
 	}
 
 	// set and check limits
@@ -127,6 +155,7 @@ func BuildModel(qConfig *Configuration, requestSize *RequestSize) (modelData *Qu
 		RequestSize:  requestSize,
 		Model:        model,
 		RateRange:    rateRange,
+		effConc:      newEffConcParms(parms, requestSize),
 	}
 }
 
@@ -152,7 +181,7 @@ func (qa *QueueAnalyzer) Analyze(requestRate float32) (metrics *AnalysisMetrics,
 	// get statistics
 	avgNumInServ := model.GetAvgNumInServers()
 
-	effConc := EffectiveConcurrency(model.GetAvgServTime(), qa.ServiceParms, qa.RequestSize, qa.MaxBatchSize)
+	effConc := qa.effConc.eval(model.GetAvgServTime(), qa.MaxBatchSize)
 	prefillTime := qa.ServiceParms.Prefill.PrefillTime(qa.RequestSize.AvgInputTokens, effConc)
 	tokenTime := qa.ServiceParms.Decode.DecodeTime(effConc)
 
@@ -173,11 +202,6 @@ func (qa *QueueAnalyzer) Analyze(requestRate float32) (metrics *AnalysisMetrics,
 	return metrics, nil
 }
 
-// global variables used by eval functions, to be set before calling eval function
-var evalRequestSize *RequestSize   // number of input and output tokens per request
-var evalServiceParms *ServiceParms // request processing parameters for prefill and decode stages
-var evalMaxBatchSize int           // max batch size
-
 // evaluate max request rates to achieve a given target performance, returns
 //   - max request rates
 //   - performance metrics at min of max request rates
@@ -193,18 +217,27 @@ func (qa *QueueAnalyzer) Size(targetPerf *TargetPerf) (targetRate *TargetRate, m
 	lambdaMin := qa.RateRange.Min / 1000
 	lambdaMax := qa.RateRange.Max / 1000
 
-	// set global variables for model and parameters used in functional evaluation
-	Model = qa.Model
-	evalRequestSize = qa.RequestSize
-	evalServiceParms = qa.ServiceParms
-	evalMaxBatchSize = qa.MaxBatchSize
-
 	var ind int
 
+	// ITL is linear in the effective concurrency, which is bounded by the max batch size,
+	// hence no ITL search is needed if the target is met at the max batch size
+	searchITL := targetITL > 0 && qa.ServiceParms.Decode.DecodeTime(float32(qa.MaxBatchSize)) > targetITL
+
+	// evaluate TTFT and ITL at both ends of the rate range, solving the model once per end for both searches
+	var ttftBounds, itlBounds [2]float32
+	if targetTTFT > 0 || searchITL {
+		for i, x := range [2]float32{lambdaMin, lambdaMax} {
+			if ttftBounds[i], itlBounds[i], err = qa.evalTargets(x); err != nil {
+				return nil, nil, nil, fmt.Errorf("failed to evaluate targets at rate bounds, range=%s, err=%v",
+					qa.RateRange, err)
+			}
+		}
+	}
+
 	// find max rate to achieve target TTFT time
 	lambdaStarTTFT := lambdaMax
 	if targetTTFT > 0 {
-		lambdaStarTTFT, ind, err = BinarySearch(lambdaMin, lambdaMax, targetTTFT, EvalTTFT)
+		lambdaStarTTFT, ind, err = binarySearchFromBounds(lambdaMin, lambdaMax, ttftBounds[0], ttftBounds[1], targetTTFT, qa.evalTTFT)
 		if ind < 0 {
 			err = fmt.Errorf("target is below the bounded region")
 		}
@@ -216,8 +249,8 @@ func (qa *QueueAnalyzer) Size(targetPerf *TargetPerf) (targetRate *TargetRate, m
 
 	// find max rate to achieve target ITL time
 	lambdaStarITL := lambdaMax
-	if targetITL > 0 {
-		lambdaStarITL, ind, err = BinarySearch(lambdaMin, lambdaMax, targetITL, EvalITL)
+	if searchITL {
+		lambdaStarITL, ind, err = binarySearchFromBounds(lambdaMin, lambdaMax, itlBounds[0], itlBounds[1], targetITL, qa.evalITL)
 		if ind < 0 {
 			err = fmt.Errorf("target is below the bounded region")
 		}
@@ -265,28 +298,32 @@ func (p *DecodeParms) DecodeTime(batchSize float32) float32 {
 	return p.Alpha + p.Beta*batchSize
 }
 
-// Function used in binary search (target TTFT)
+// evaluate TTFT and ITL from a single model solution
 //   - x is lambda req/msec
-func EvalTTFT(x float32) (float32, error) {
-	Model.Solve(x, 1)
-	if !Model.IsValid() {
-		return 0, fmt.Errorf("invalid model %s", Model)
+func (qa *QueueAnalyzer) evalTargets(x float32) (ttft float32, itl float32, err error) {
+	model := qa.Model
+	model.Solve(x, 1)
+	if !model.IsValid() {
+		return 0, 0, fmt.Errorf("invalid model %s", model)
 	}
-	avgWaitTime := Model.GetAvgWaitTime()
-	effConc := EffectiveConcurrency(Model.GetAvgServTime(), evalServiceParms, evalRequestSize, evalMaxBatchSize)
-	ttft := avgWaitTime + evalServiceParms.Prefill.PrefillTime(evalRequestSize.AvgInputTokens, effConc)
-	return ttft, nil
+	effConc := qa.effConc.eval(model.GetAvgServTime(), qa.MaxBatchSize)
+	ttft = model.GetAvgWaitTime() + qa.ServiceParms.Prefill.PrefillTime(qa.RequestSize.AvgInputTokens, effConc)
+	itl = qa.ServiceParms.Decode.DecodeTime(effConc)
+	return ttft, itl, nil
 }
 
-// Function used in binary search (target ITL)
+// Method used in binary search (target TTFT)
 //   - x is lambda req/msec
-func EvalITL(x float32) (float32, error) {
-	Model.Solve(x, 1)
-	if !Model.IsValid() {
-		return 0, fmt.Errorf("invalid model %s", Model)
-	}
-	effConc := EffectiveConcurrency(Model.GetAvgServTime(), evalServiceParms, evalRequestSize, evalMaxBatchSize)
-	return evalServiceParms.Decode.DecodeTime(effConc), nil
+func (qa *QueueAnalyzer) evalTTFT(x float32) (float32, error) {
+	ttft, _, err := qa.evalTargets(x)
+	return ttft, err
+}
+
+// Method used in binary search (target ITL)
+//   - x is lambda req/msec
+func (qa *QueueAnalyzer) evalITL(x float32) (float32, error) {
+	_, itl, err := qa.evalTargets(x)
+	return itl, err
 }
 
 // calculate effective average number of requests in service (n), given average request service time
@@ -294,11 +331,7 @@ func EvalITL(x float32) (float32, error) {
 //   - prefillTime(n) = gamma + delta * inTokens * n
 //   - totalDecodeTime(n) = (alpha + beta * n) * (outTokens - 1)
 func EffectiveConcurrency(avgServiceTime float32, serviceParms *ServiceParms, requestSize *RequestSize, maxBatchSize int) float32 {
-	tokens := float32(requestSize.AvgOutputTokens - 1)
-	numerator := avgServiceTime - (serviceParms.Prefill.Gamma + serviceParms.Decode.Alpha*tokens)
-	denominator := (serviceParms.Prefill.Delta * float32(requestSize.AvgInputTokens)) + (serviceParms.Decode.Beta * tokens)
-	n := numerator / denominator
-	return min(max(n, 0), float32(maxBatchSize))
+	return newEffConcParms(serviceParms, requestSize).eval(avgServiceTime, maxBatchSize)
 }
 
 // check validity of configuration parameters
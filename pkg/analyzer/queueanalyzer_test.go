@@ -553,6 +553,49 @@ func TestQueueAnalyzer_Size(t *testing.T) {
 	}
 }
 
+func TestQueueAnalyzer_Size_NonBindingITL(t *testing.T) {
+	requestSize := &analyzer.RequestSize{AvgInputTokens: 100, AvgOutputTokens: 10}
+	tests := []struct {
+		name   string
+		decode *analyzer.DecodeParms
+	}{
+		{
+			name:   "increasing decode time",
+			decode: &analyzer.DecodeParms{Alpha: 1.0, Beta: 0.01},
+		},
+		{
+			name:   "constant decode time",
+			decode: &analyzer.DecodeParms{Alpha: 1.0, Beta: 0},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			config := &analyzer.Configuration{
+				MaxBatchSize: testConfig.MaxBatchSize,
+				MaxQueueSize: testConfig.MaxQueueSize,
+				ServiceParms: &analyzer.ServiceParms{
+					Prefill: testConfig.ServiceParms.Prefill,
+					Decode:  tt.decode,
+				},
+			}
+			qa, err := analyzer.NewQueueAnalyzer(config, requestSize)
+			if err != nil {
+				t.Fatalf("Failed to create QueueAnalyzer: %v", err)
+			}
+
+			// ITL at max batch size is below target, so the target does not limit the rate
+			targetRate, _, _, err := qa.Size(&analyzer.TargetPerf{TargetITL: 5.0})
+			if err != nil {
+				t.Fatalf("Size() failed: %v", err)
+			}
+			if targetRate.RateTargetITL != qa.RateRange.Max {
+				t.Errorf("RateTargetITL = %v, want max rate %v", targetRate.RateTargetITL, qa.RateRange.Max)
+			}
+		})
+	}
+}
+
 func TestEffectiveConcurrency(t *testing.T) {
 	serviceParms := testConfig.ServiceParms
 	requestSize := &analyzer.RequestSize{AvgInputTokens: 100, AvgOutputTokens: 10}
@@ -314,7 +314,7 @@ func TestMM1ModelStateDependent_Creation(t *testing.T) {
 			}
 
 			for i, rate := range tt.servRate {
-				if model.servRate[i] != rate {
+				if model.servRate[i] != float64(rate) {
 					t.Errorf("Service rate[%d] = %v, want %v", i, model.servRate[i], rate)
 				}
 			}
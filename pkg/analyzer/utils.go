@@ -5,8 +5,8 @@ import (
 	"math"
 )
 
-var epsilon float32 = 1e-6
-var maxIterations int = 100
+const epsilon float32 = 1e-6
+const maxIterations int = 100
 
 // A variable x is relatively within a given tolerance from a value
 func WithinTolerance(x, value, tolerance float32) bool {
@@ -26,32 +26,44 @@ func WithinTolerance(x, value, tolerance float32) bool {
 func BinarySearch(xMin float32, xMax float32, yTarget float32,
 	eval func(float32) (float32, error)) (float32, int, error) {
 
-	if xMin > xMax {
-		return 0, 0, fmt.Errorf("invalid range [%v, %v]", xMin, xMax)
-	}
-
 	// evaluate the function at the boundaries
-	yBounds := make([]float32, 2)
+	var yBounds [2]float32
 	var err error
-	for i, x := range []float32{xMin, xMax} {
+	for i, x := range [2]float32{xMin, xMax} {
 		if yBounds[i], err = eval(x); err != nil {
 			return 0, 0, fmt.Errorf("invalid function evaluation: %v", err)
 		}
-		if WithinTolerance(yBounds[i], yTarget, epsilon) {
-			return x, 0, nil
-		}
 	}
+	return binarySearchFromBounds(xMin, xMax, yBounds[0], yBounds[1], yTarget, eval)
+}
+
+// Binary search as above, given the (already evaluated) function values yMin=f(xMin) and yMax=f(xMax).
+// Allows callers to share boundary evaluations among several searches over the same range.
+func binarySearchFromBounds(xMin float32, xMax float32, yMin float32, yMax float32, yTarget float32,
+	eval func(float32) (float32, error)) (float32, int, error) {
 
-	increasing := yBounds[0] < yBounds[1]
-	if increasing && yTarget < yBounds[0] || !increasing && yTarget > yBounds[0] {
+	if xMin > xMax {
+		return 0, 0, fmt.Errorf("invalid range [%v, %v]", xMin, xMax)
+	}
+
+	if WithinTolerance(yMin, yTarget, epsilon) {
+		return xMin, 0, nil
+	}
+	if WithinTolerance(yMax, yTarget, epsilon) {
+		return xMax, 0, nil
+	}
+
+	increasing := yMin < yMax
+	if increasing && yTarget < yMin || !increasing && yTarget > yMin {
 		return xMin, -1, nil // target is below the bounded region
 	}
-	if increasing && yTarget > yBounds[1] || !increasing && yTarget < yBounds[1] {
+	if increasing && yTarget > yMax || !increasing && yTarget < yMax {
 		return xMax, +1, nil // target is above the bounded region
 	}
 
 	// perform binary search
 	var xStar, yStar float32
+	var err error
 	for range maxIterations {
 		xStar = 0.5 * (xMin + xMax)
 		if yStar, err = eval(xStar); err != nil {
@@ -69,23 +81,20 @@ func BinarySearch(xMin float32, xMax float32, yTarget float32,
 	return xStar, 0, nil
 }
 
-// model as global variable, accesses by eval functions
-var Model *MM1ModelStateDependent
-
 // Function used in binary search (target service time)
-func EvalServTime(x float32) (float32, error) {
-	Model.Solve(x, 1)
-	if !Model.IsValid() {
-		return 0, fmt.Errorf("invalid model %v", Model)
+func (m *MM1ModelStateDependent) EvalServTime(x float32) (float32, error) {
+	m.Solve(x, 1)
+	if !m.IsValid() {
+		return 0, fmt.Errorf("invalid model %v", m)
 	}
-	return Model.GetAvgServTime(), nil
+	return m.GetAvgServTime(), nil
 }
 
 // Function used in binary search (target waiting time)
-func EvalWaitingTime(x float32) (float32, error) {
-	Model.Solve(x, 1)
-	if !Model.IsValid() {
-		return 0, fmt.Errorf("invalid model %v", Model)
+func (m *MM1ModelStateDependent) EvalWaitingTime(x float32) (float32, error) {
+	m.Solve(x, 1)
+	if !m.IsValid() {
+		return 0, fmt.Errorf("invalid model %v", m)
 	}
-	return Model.GetAvgWaitTime(), nil
+	return m.GetAvgWaitTime(), nil
 }
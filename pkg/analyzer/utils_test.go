@@ -222,6 +222,17 @@ func TestBinarySearch(t *testing.T) {
 	}
 }
 
+func TestBinarySearchFromBounds_InvalidRange(t *testing.T) {
+	linear := func(x float32) (float32, error) {
+		return 2 * x, nil
+	}
+
+	// the range is validated even when the caller supplies the boundary values
+	if _, _, err := binarySearchFromBounds(5.0, 1.0, 10.0, 2.0, 6.0, linear); err == nil {
+		t.Error("binarySearchFromBounds() expected error for invalid range")
+	}
+}
+
 func TestBinarySearch_EdgeCases(t *testing.T) {
 	// Constant function
 	constant := func(x float32) (float32, error) {
@@ -289,10 +300,9 @@ func TestBinarySearch_EdgeCases(t *testing.T) {
 }
 
 func TestEvalServTime(t *testing.T) {
-	// Create a test model - use state-dependent model for global variable
+	// Create a test model - use state-dependent model for eval functions
 	servRates := []float32{1.0, 2.0, 3.0, 4.0, 5.0}
 	model := NewMM1ModelStateDependent(5, servRates)
-	Model = model // Set global variable for eval functions
 
 	tests := []struct {
 		name    string
@@ -318,7 +328,7 @@ func TestEvalServTime(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			result, err := EvalServTime(tt.lambda)
+			result, err := model.EvalServTime(tt.lambda)
 
 			if (err != nil) != tt.wantErr {
 				t.Errorf("EvalServTime() error = %v, wantErr %v", err, tt.wantErr)
@@ -335,10 +345,9 @@ func TestEvalServTime(t *testing.T) {
 }
 
 func TestEvalWaitingTime(t *testing.T) {
-	// Create a test model - use state-dependent model for global variable
+	// Create a test model - use state-dependent model for eval functions
 	servRates := []float32{1.0, 2.0, 3.0, 4.0, 5.0}
 	model := NewMM1ModelStateDependent(5, servRates)
-	Model = model // Set global variable for eval functions
 
 	tests := []struct {
 		name    string
@@ -364,7 +373,7 @@ func TestEvalWaitingTime(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			result, err := EvalWaitingTime(tt.lambda)
+			result, err := model.EvalWaitingTime(tt.lambda)
 
 			if (err != nil) != tt.wantErr {
 				t.Errorf("EvalWaitingTime() error = %v, wantErr %v", err, tt.wantErr)
@@ -380,8 +389,7 @@ func TestEvalWaitingTime(t *testing.T) {
 	}
 }
 
-func TestEvalTTFT(t *testing.T) {
-	// Set up global variables for eval functions
+func TestQueueAnalyzer_EvalTTFT(t *testing.T) {
 	config := &Configuration{
 		MaxBatchSize: 4,
 		MaxQueueSize: 8,
@@ -399,10 +407,6 @@ func TestEvalTTFT(t *testing.T) {
 	requestSize := &RequestSize{AvgInputTokens: 100, AvgOutputTokens: 10}
 
 	qa := BuildModel(config, requestSize)
-	Model = qa.Model
-	evalRequestSize = requestSize
-	evalServiceParms = config.ServiceParms
-	evalMaxBatchSize = config.MaxBatchSize
 
 	tests := []struct {
 		name    string
@@ -428,29 +432,28 @@ func TestEvalTTFT(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			result, err := EvalTTFT(tt.lambda)
+			result, err := qa.evalTTFT(tt.lambda)
 
 			if (err != nil) != tt.wantErr {
-				t.Errorf("EvalTTFT() error = %v, wantErr %v", err, tt.wantErr)
+				t.Errorf("evalTTFT() error = %v, wantErr %v", err, tt.wantErr)
 				return
 			}
 
 			if !tt.wantErr {
 				if result < 0 {
-					t.Errorf("EvalTTFT() = %v, should be non-negative", result)
+					t.Errorf("evalTTFT() = %v, should be non-negative", result)
 				}
 
 				// TTFT should include waiting time and prefill time
 				if result < 10.0 { // At least the base prefill time (gamma)
-					t.Errorf("EvalTTFT() = %v, should be at least base prefill time", result)
+					t.Errorf("evalTTFT() = %v, should be at least base prefill time", result)
 				}
 			}
 		})
 	}
 }
 
-func TestEvalITL(t *testing.T) {
-	// Set up global variables for eval functions
+func TestQueueAnalyzer_EvalITL(t *testing.T) {
 	config := &Configuration{
 		MaxBatchSize: 4,
 		MaxQueueSize: 8,
@@ -468,10 +471,6 @@ func TestEvalITL(t *testing.T) {
 	requestSize := &RequestSize{AvgInputTokens: 100, AvgOutputTokens: 10}
 
 	qa := BuildModel(config, requestSize)
-	Model = qa.Model
-	evalRequestSize = requestSize
-	evalServiceParms = config.ServiceParms
-	evalMaxBatchSize = config.MaxBatchSize
 
 	tests := []struct {
 		name    string
@@ -497,21 +496,21 @@ func TestEvalITL(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			result, err := EvalITL(tt.lambda)
+			result, err := qa.evalITL(tt.lambda)
 
 			if (err != nil) != tt.wantErr {
-				t.Errorf("EvalITL() error = %v, wantErr %v", err, tt.wantErr)
+				t.Errorf("evalITL() error = %v, wantErr %v", err, tt.wantErr)
 				return
 			}
 
 			if !tt.wantErr {
 				if result < 0 {
-					t.Errorf("EvalITL() = %v, should be non-negative", result)
+					t.Errorf("evalITL() = %v, should be non-negative", result)
 				}
 
 				// ITL should be at least the base decode time (alpha)
 				if result < 1.0 {
-					t.Errorf("EvalITL() = %v, should be at least base decode time", result)
+					t.Errorf("evalITL() = %v, should be at least base decode time", result)
 				}
 			}
 		})
@@ -537,10 +536,6 @@ func TestBinarySearchWithAnalyzerFunctions(t *testing.T) {
 	requestSize := &RequestSize{AvgInputTokens: 100, AvgOutputTokens: 10}
 
 	qa := BuildModel(config, requestSize)
-	Model = qa.Model
-	evalRequestSize = requestSize
-	evalServiceParms = config.ServiceParms
-	evalMaxBatchSize = config.MaxBatchSize
 
 	lambdaMin := qa.RateRange.Min / 1000 // Convert to requests per msec
 	lambdaMax := qa.RateRange.Max / 1000
@@ -554,25 +549,25 @@ func TestBinarySearchWithAnalyzerFunctions(t *testing.T) {
 		{
 			name:        "find lambda for target TTFT",
 			yTarget:     25.0, // 25 msec target TTFT
-			evalFunc:    EvalTTFT,
+			evalFunc:    qa.evalTTFT,
 			description: "time to first token",
 		},
 		{
 			name:        "find lambda for target ITL",
 			yTarget:     2.0, // 2 msec target inter-token latency
-			evalFunc:    EvalITL,
+			evalFunc:    qa.evalITL,
 			description: "inter-token latency",
 		},
 		{
 			name:        "find lambda for target service time",
 			yTarget:     50.0, // 50 msec target service time
-			evalFunc:    EvalServTime,
+			evalFunc:    qa.Model.EvalServTime,
 			description: "service time",
 		},
 		{
 			name:        "find lambda for target waiting time",
 			yTarget:     10.0, // 10 msec target waiting time
-			evalFunc:    EvalWaitingTime,
+			evalFunc:    qa.Model.EvalWaitingTime,
 			description: "waiting time",
 		},
 	}
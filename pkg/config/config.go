@@ -10,32 +10,33 @@ const (
 	RoundRobin                                          // 3 : allocating in round-robin fashion across all servers
 )
 
+// names of allocation policies, indexed by policy
+var saturatedAllocationPolicyNames = [...]string{
+	None:               "None",
+	PriorityExhaustive: "PriorityExhaustive",
+	PriorityRoundRobin: "PriorityRoundRobin",
+	RoundRobin:         "RoundRobin",
+}
+
+// allocation policies by name
+var saturatedAllocationPolicies = func() map[string]SaturatedAllocationPolicy {
+	policies := make(map[string]SaturatedAllocationPolicy, len(saturatedAllocationPolicyNames))
+	for p, name := range saturatedAllocationPolicyNames {
+		policies[name] = SaturatedAllocationPolicy(p)
+	}
+	return policies
+}()
+
 func (p SaturatedAllocationPolicy) String() string {
-	switch p {
-	case None:
-		return "None"
-	case PriorityExhaustive:
-		return "PriorityExhaustive"
-	case PriorityRoundRobin:
-		return "PriorityRoundRobin"
-	case RoundRobin:
-		return "RoundRobin"
-	default:
+	if p < 0 || int(p) >= len(saturatedAllocationPolicyNames) {
 		return "Unknown"
 	}
+	return saturatedAllocationPolicyNames[p]
 }
 
 func SaturatedAllocationPolicyEnum(s string) SaturatedAllocationPolicy {
-	switch s {
-	case "None":
-		return None
-	case "PriorityExhaustive":
-		return PriorityExhaustive
-	case "PriorityRoundRobin":
-		return PriorityRoundRobin
-	case "RoundRobin":
-		return RoundRobin
-	default:
-		return DefaultSaturatedAllocationPolicy
+	if p, exists := saturatedAllocationPolicies[s]; exists {
+		return p
 	}
+	return DefaultSaturatedAllocationPolicy
 }
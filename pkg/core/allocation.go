@@ -25,24 +25,33 @@ type Allocation struct {
 
 // Create an allocation of an accelerator to a server; nil if not feasible
 func CreateAllocation(serverName string, gName string) *Allocation {
-	var (
-		acc *Accelerator
+	in := newAllocationInputs(serverName)
+	if in == nil {
+		return nil
+	}
+	return in.createAllocation(gName)
+}
 
+// Server related inputs to creating allocations, resolved once for all candidate accelerators of a server
+type allocationInputs struct {
+	server *Server
+	load   *config.ServerLoadSpec
+	model  *Model
+	target *Target
+}
+
+// Resolve server, load, model, and target of a server; nil if any is missing or invalid
+func newAllocationInputs(serverName string) *allocationInputs {
+	var (
 		server *Server
 		load   *config.ServerLoadSpec
 
 		model *Model
-		perf  *config.ModelAcceleratorPerfData
 
 		svc    *ServiceClass
 		target *Target
 	)
 
-	// get accelerator info
-	if acc = GetAccelerator(gName); acc == nil {
-		return nil
-	}
-
 	// get server info
 	if server = GetServer(serverName); server == nil {
 		return nil
@@ -57,9 +66,6 @@ func CreateAllocation(serverName string, gName string) *Allocation {
 	if model = GetModel(modelName); model == nil {
 		return nil
 	}
-	if perf = model.PerfData(gName); perf == nil {
-		return nil
-	}
 
 	// get service class info
 	if svc = GetServiceClass(server.ServiceClassName()); svc == nil {
@@ -68,6 +74,24 @@ func CreateAllocation(serverName string, gName string) *Allocation {
 	if target = svc.ModelTarget(modelName); target == nil {
 		return nil
 	}
+	return &allocationInputs{server: server, load: load, model: model, target: target}
+}
+
+// Create an allocation of an accelerator to the server of the inputs; nil if not feasible
+func (in *allocationInputs) createAllocation(gName string) *Allocation {
+	var (
+		acc  *Accelerator
+		perf *config.ModelAcceleratorPerfData
+	)
+	server, load, model, target := in.server, in.load, in.model, in.target
+
+	// get accelerator info
+	if acc = GetAccelerator(gName); acc == nil {
+		return nil
+	}
+	if perf = model.PerfData(gName); perf == nil {
+		return nil
+	}
 
 	// handle zero traffic case
 	if load.ArrivalRate == 0 || load.AvgOutTokens == 0 {
@@ -107,12 +131,6 @@ func CreateAllocation(serverName string, gName string) *Allocation {
 		AvgOutputTokens: K,
 	}
 
-	queueAnalyzer, err := analyzer.NewQueueAnalyzer(qConfig, requestData)
-	if err != nil {
-		fmt.Println(err)
-		return nil
-	}
-
 	// TODO: do we need this?
 	// waitTimeLimit := target.TTFT / config.SLOMargin // distribution of waiting time assumed exponential
 
@@ -123,12 +141,11 @@ func CreateAllocation(serverName string, gName string) *Allocation {
 	}
 
 	// determine max rates to satisfy targets
-	_, metrics, _, err := queueAnalyzer.Size(targetPerf)
-	if err != nil {
-		// fmt.Println(err)
+	sizing, queueAnalyzer := TheSystem.sizeQueue(qConfig, requestData, targetPerf)
+	if !sizing.feasible {
 		return nil
 	}
-	rateStar := metrics.Throughput
+	rateStar := sizing.rateStar
 
 	// calculate number of replicas
 	var totalRate float32
@@ -144,9 +161,16 @@ func CreateAllocation(serverName string, gName string) *Allocation {
 	totalNumInstances := model.NumInstances(gName) * numReplicas
 	cost := acc.Cost() * float32(totalNumInstances)
 
-	// analyze queue of one replica
+	// analyze queue of one replica, on the analyzer built for sizing, or a new one if sizing was memoized
+	if queueAnalyzer == nil {
+		var err error
+		if queueAnalyzer, err = analyzer.NewQueueAnalyzer(qConfig, requestData); err != nil {
+			fmt.Println(err)
+			return nil
+		}
+	}
 	rate := totalRate / float32(numReplicas)
-	metrics, err = queueAnalyzer.Analyze(rate)
+	metrics, err := queueAnalyzer.Analyze(rate)
 	if err != nil {
 		fmt.Println(err)
 		return nil
@@ -162,6 +186,63 @@ func CreateAllocation(serverName string, gName string) *Allocation {
 	return alloc
 }
 
+// Key of memoized queue sizing: the max throughput of a replica depends only on
+// the queue configuration, the request size, and the performance targets
+type sizingKey struct {
+	maxBatchSize int
+	maxQueueSize int
+	prefill      analyzer.PrefillParms
+	decode       analyzer.DecodeParms
+	requestSize  analyzer.RequestSize
+	targetPerf   analyzer.TargetPerf
+}
+
+// Memoized queue sizing; only values are kept, so no analyzer state is shared between allocations
+type sizing struct {
+	feasible bool    // targets can be satisfied
+	rateStar float32 // max throughput of a replica satisfying the targets (req/sec)
+}
+
+// Size a queue to satisfy performance targets, reusing earlier results for the same inputs
+// (servers of the same model on the same accelerator with similar request sizes share results)
+//   - if the queue is sized anew, the analyzer built for it is returned to the caller, and not kept
+//   - if an earlier result is reused, no analyzer is built and nil is returned
+func (s *System) sizeQueue(qConfig *analyzer.Configuration, requestData *analyzer.RequestSize,
+	targetPerf *analyzer.TargetPerf) (sizing, *analyzer.QueueAnalyzer) {
+
+	key := sizingKey{
+		maxBatchSize: qConfig.MaxBatchSize,
+		maxQueueSize: qConfig.MaxQueueSize,
+		prefill:      *qConfig.ServiceParms.Prefill,
+		decode:       *qConfig.ServiceParms.Decode,
+		requestSize:  *requestData,
+		targetPerf:   *targetPerf,
+	}
+	if result, exists := s.sizings[key]; exists {
+		return result, nil
+	}
+
+	if s.sizings == nil {
+		s.sizings = make(map[sizingKey]sizing)
+	}
+	if result, exists := s.prevSizings[key]; exists {
+		s.sizings[key] = result
+		return result, nil
+	}
+	result := sizing{}
+	queueAnalyzer, err := analyzer.NewQueueAnalyzer(qConfig, requestData)
+	if err != nil {
+		fmt.Println(err)
+		s.sizings[key] = result
+		return result, nil
+	}
+	if _, metrics, _, err := queueAnalyzer.Size(targetPerf); err == nil {
+		result = sizing{feasible: true, rateStar: metrics.Throughput}
+	}
+	s.sizings[key] = result
+	return result, queueAnalyzer
+}
+
 func (a *Allocation) Scale(serverName string) (alloc *Allocation, inc int) {
 	var (
 		acc    *Accelerator
@@ -190,10 +271,14 @@ func (a *Allocation) Scale(serverName string) (alloc *Allocation, inc int) {
 }
 
 func (a *Allocation) ReAllocate(serverName string) (*Allocation, string) {
+	in := newAllocationInputs(serverName)
+	if in == nil {
+		return nil, ""
+	}
 	minVal := float32(0)
 	var minAlloc *Allocation
 	for gName := range GetAccelerators() {
-		if alloc := CreateAllocation(serverName, gName); alloc != nil {
+		if alloc := in.createAllocation(gName); alloc != nil {
 			if minVal == 0 || alloc.value < minVal {
 				minVal = alloc.value
 				minAlloc = alloc
@@ -315,7 +400,13 @@ func (a *Allocation) Clone() *Allocation {
 }
 
 func (a *Allocation) AllocationData() *config.AllocationData {
-	return &config.AllocationData{
+	data := a.allocationData()
+	return &data
+}
+
+// Allocation data by value, for callers storing it in place
+func (a *Allocation) allocationData() config.AllocationData {
+	return config.AllocationData{
 		Accelerator: a.accelerator,
 		NumReplicas: a.numReplicas,
 		MaxBatch:    a.batchSize,
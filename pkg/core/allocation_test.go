@@ -775,6 +775,135 @@ func TestCreateAllocation(t *testing.T) {
 	}
 }
 
+func TestCreateAllocation_MemoizedSizing(t *testing.T) {
+	setupCompleteTestSystem()
+	defer func() { TheSystem = nil }()
+
+	TheSystem.serviceClasses["default"].targets["test-model"].TTFT = 5000
+
+	// two servers of the same model and request size, differing in arrival rate only
+	for i, name := range []string{"test-server", "test-server-2"} {
+		server := NewServerFromSpec(&config.ServerSpec{
+			Name:           name,
+			Model:          "test-model",
+			Class:          "default",
+			MinNumReplicas: 1,
+		})
+		server.load = &config.ServerLoadSpec{
+			ArrivalRate:  float32(60 * (i + 1)),
+			AvgInTokens:  100,
+			AvgOutTokens: 200,
+		}
+		TheSystem.servers[name] = server
+	}
+
+	alloc1 := CreateAllocation("test-server", "test-gpu")
+	alloc2 := CreateAllocation("test-server-2", "test-gpu")
+	if alloc1 == nil || alloc2 == nil {
+		t.Fatalf("CreateAllocation() = %v, %v, want non-nil", alloc1, alloc2)
+	}
+	if len(TheSystem.sizings) != 1 {
+		t.Errorf("number of memoized sizings = %d, want 1", len(TheSystem.sizings))
+	}
+	if alloc1.maxArrvRatePerReplica != alloc2.maxArrvRatePerReplica {
+		t.Errorf("maxArrvRatePerReplica = %v and %v, want equal", alloc1.maxArrvRatePerReplica, alloc2.maxArrvRatePerReplica)
+	}
+
+	// a different request size is sized separately
+	TheSystem.servers["test-server-2"].load.AvgInTokens = 50
+	if alloc := CreateAllocation("test-server-2", "test-gpu"); alloc == nil {
+		t.Fatalf("CreateAllocation() = nil, want non-nil")
+	}
+	if len(TheSystem.sizings) != 2 {
+		t.Errorf("number of memoized sizings = %d, want 2", len(TheSystem.sizings))
+	}
+}
+
+func TestSystem_ReuseSizings(t *testing.T) {
+	// system of an optimization cycle, with a loaded server
+	setup := func() {
+		setupCompleteTestSystem()
+		TheSystem.serviceClasses["default"].targets["test-model"].TTFT = 5000
+		TheSystem.servers["test-server"].load = &config.ServerLoadSpec{
+			ArrivalRate:  60,
+			AvgInTokens:  100,
+			AvgOutTokens: 200,
+		}
+	}
+	setup()
+	defer func() { TheSystem = nil }()
+
+	if alloc := CreateAllocation("test-server", "test-gpu"); alloc == nil {
+		t.Fatal("CreateAllocation() = nil, want non-nil")
+	}
+	prev := TheSystem.Sizings()
+	if len(prev.results) != 1 {
+		t.Fatalf("number of sizings = %d, want 1", len(prev.results))
+	}
+
+	// mark the previous result, to tell a reused result from a recomputed one
+	var marked sizing
+	for key, result := range prev.results {
+		result.rateStar /= 2
+		prev.results[key] = result
+		marked = result
+	}
+	for _, result := range TheSystem.sizings {
+		if result == marked {
+			t.Errorf("sizings of the system changed through a snapshot")
+		}
+	}
+
+	tests := []struct {
+		name       string
+		change     func()
+		wantReused bool
+	}{
+		{
+			name:       "same inputs",
+			change:     func() {},
+			wantReused: true,
+		},
+		{
+			name: "decode parameters changed",
+			change: func() {
+				TheSystem.models["test-model"].perfData["test-gpu"].DecodeParms.Alpha = 6.0
+			},
+			wantReused: false,
+		},
+		{
+			name: "max batch size changed",
+			change: func() {
+				TheSystem.models["test-model"].perfData["test-gpu"].MaxBatchSize = 8
+			},
+			wantReused: false,
+		},
+		{
+			name: "targets changed",
+			change: func() {
+				TheSystem.serviceClasses["default"].targets["test-model"].TTFT = 4000
+			},
+			wantReused: false,
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			// next cycle: a new system picks up the results of the previous one
+			setup()
+			tt.change()
+			TheSystem.ReuseSizings(prev)
+			alloc := CreateAllocation("test-server", "test-gpu")
+			if alloc == nil {
+				t.Fatal("CreateAllocation() = nil, want non-nil")
+			}
+			if reused := alloc.maxArrvRatePerReplica == marked.rateStar/1000; reused != tt.wantReused {
+				t.Errorf("sizing reused = %v, want %v", reused, tt.wantReused)
+			}
+		})
+	}
+}
+
 func TestAllocation_Scale(t *testing.T) {
 	// Setup system and create allocation using CreateAllocation
 	setupCompleteTestSystem()
@@ -53,34 +53,65 @@ func NewServerFromSpec(spec *config.ServerSpec) *Server {
 
 // Calculate allocations for a set of accelerators
 func (s *Server) Calculate(accelerators map[string]*Accelerator) {
-	candidateAccelerators := s.GetCandidateAccelerators(accelerators)
 	s.allAllocations = make(map[string]*Allocation)
-	for _, g := range candidateAccelerators {
-		if alloc := CreateAllocation(s.name, g.Name()); alloc != nil {
-			if s.curAllocation != nil {
-				penalty := s.curAllocation.TransitionPenalty(alloc)
-				alloc.SetValue(penalty)
-			}
-			s.allAllocations[g.Name()] = alloc
+
+	// a server keeping its accelerator has a single candidate, evaluated without building a candidate set
+	if curAcc, keep := s.keptAccelerator(accelerators); keep {
+		if curAcc == nil {
+			return
+		}
+		if in := newAllocationInputs(s.name); in != nil {
+			s.addAllocation(in, curAcc.Name())
 		}
+		return
+	}
+
+	if len(accelerators) == 0 {
+		return
+	}
+	// resolve server related inputs once for all candidate accelerators
+	in := newAllocationInputs(s.name)
+	if in == nil {
+		return
+	}
+	for _, g := range accelerators {
+		s.addAllocation(in, g.Name())
+	}
+}
+
+// Add allocation on an accelerator, if feasible, valued by the penalty of transitioning to it
+func (s *Server) addAllocation(in *allocationInputs, gName string) {
+	if alloc := in.createAllocation(gName); alloc != nil {
+		if s.curAllocation != nil {
+			penalty := s.curAllocation.TransitionPenalty(alloc)
+			alloc.SetValue(penalty)
+		}
+		s.allAllocations[gName] = alloc
 	}
 }
 
 // Create a subset of candidate accelerators for a server from a given set
 func (s *Server) GetCandidateAccelerators(accelerators map[string]*Accelerator) map[string]*Accelerator {
-	if s.keepAccelerator {
-		if s.curAllocation != nil && s.curAllocation.accelerator != "" {
-			accMap := make(map[string]*Accelerator)
-			curAccName := s.curAllocation.accelerator
-			if curAcc := accelerators[curAccName]; curAcc != nil {
-				accMap[curAccName] = curAcc
-			}
-			return accMap
+	if curAcc, keep := s.keptAccelerator(accelerators); keep {
+		accMap := make(map[string]*Accelerator)
+		if curAcc != nil {
+			accMap[s.curAllocation.accelerator] = curAcc
 		}
+		return accMap
 	}
 	return accelerators
 }
 
+// Current accelerator of a server keeping its accelerator, from a given set
+//   - keep is false if the server may move to any accelerator
+//   - curAcc is nil if the current accelerator is not in the set
+func (s *Server) keptAccelerator(accelerators map[string]*Accelerator) (curAcc *Accelerator, keep bool) {
+	if s.keepAccelerator && s.curAllocation != nil && s.curAllocation.accelerator != "" {
+		return accelerators[s.curAllocation.accelerator], true
+	}
+	return nil, false
+}
+
 func (s *Server) Name() string {
 	return s.name
 }
@@ -147,7 +178,7 @@ func (s *Server) Saturated() bool {
 
 func (s *Server) UpdateDesiredAlloc() {
 	if s.allocation != nil {
-		s.spec.DesiredAlloc = *s.allocation.AllocationData()
+		s.spec.DesiredAlloc = s.allocation.allocationData()
 		s.spec.DesiredAlloc.Load = *s.load
 	} else {
 		s.spec.DesiredAlloc = config.AllocationData{}
@@ -38,8 +38,12 @@ func NewServiceClass(name string, priority int) *ServiceClass {
 
 func NewServiceClassFromSpec(spec *config.ServiceClassSpec) *ServiceClass {
 	svc := NewServiceClass(spec.Name, spec.Priority)
-	for _, modelTarget := range spec.ModelTargets {
-		svc.AddModelTarget(&modelTarget)
+	svc.targets = make(map[string]*Target, len(spec.ModelTargets))
+	// targets of the service class share one backing array, rather than being allocated one at a time
+	targets := make([]Target, len(spec.ModelTargets))
+	for i := range spec.ModelTargets {
+		targets[i] = targetFromSpec(&spec.ModelTargets[i])
+		svc.targets[spec.ModelTargets[i].Model] = &targets[i]
 	}
 	return svc
 }
@@ -69,14 +73,18 @@ func (c *ServiceClass) UpdateModelTargets(spec *config.ServiceClassSpec) bool {
 
 // add a model target to the service class (replace if already exists)
 func (c *ServiceClass) AddModelTarget(spec *config.ModelTarget) *Target {
-	modelName := spec.Model
-	target := &Target{
+	target := targetFromSpec(spec)
+	c.targets[spec.Model] = &target
+	return &target
+}
+
+// target SLOs of a model target specification
+func targetFromSpec(spec *config.ModelTarget) Target {
+	return Target{
 		ITL:  spec.SLO_ITL,
 		TTFT: spec.SLO_TTFT,
 		TPS:  spec.SLO_TPS,
 	}
-	c.targets[modelName] = target
-	return target
 }
 
 func (c *ServiceClass) RemoveModelTarget(modelName string) {
@@ -3,6 +3,8 @@ package core
 import (
 	"bytes"
 	"fmt"
+	"maps"
+	"slices"
 
 	"github.com/llm-d-incubation/workload-variant-autoscaler/pkg/config"
 )
@@ -54,6 +56,9 @@ type System struct {
 	capacity           map[string]int               // available count of accelerator types
 	allocationByType   map[string]*AllocationByType // number of allocated accelerator types
 	allocationSolution *config.AllocationSolution
+
+	sizings     map[sizingKey]sizing // memoized queue sizing results (created on first use)
+	prevSizings map[sizingKey]sizing // sizing results of a previous system, carried over when used again
 }
 
 // Allocation data about an accelerator type
@@ -78,6 +83,23 @@ func NewSystem() *System {
 	}
 }
 
+// Queue sizing results of a system, to be reused by a later system (e.g. of the next optimization cycle);
+// results are values keyed on all inputs of the sizing, and are not modified once taken from a system
+type Sizings struct {
+	results map[sizingKey]sizing
+}
+
+// Get a snapshot of the queue sizing results of the system
+func (s *System) Sizings() Sizings {
+	return Sizings{results: maps.Clone(s.sizings)}
+}
+
+// Reuse the queue sizing results of a previous system;
+// only results used again by this system are carried over, so unused results are not kept forever
+func (s *System) ReuseSizings(prev Sizings) {
+	s.prevSizings = prev.results
+}
+
 // Set system from spec
 func (s *System) SetFromSpec(d *config.SystemSpec) *config.OptimizerSpec {
 	s.SetAcceleratorsFromSpec(&d.Accelerators)
@@ -121,15 +143,18 @@ func (s *System) SetCountFromSpec(spec config.AcceleratorCount) {
 	s.capacity[spec.Type] = spec.Count
 }
 
-// Set models from spec
+// Set models from spec; perf data records are copied into one backing array,
+// rather than each escaping to the heap on its own
 func (s *System) SetModelsFromSpec(d *config.ModelData) {
-	for _, pd := range d.PerfData {
+	perfData := slices.Clone(d.PerfData)
+	for i := range perfData {
+		pd := &perfData[i]
 		modelName := pd.Name
 		var model *Model
 		if model = s.models[modelName]; model == nil {
 			model = s.AddModel(modelName)
 		}
-		model.AddPerfDataFromSpec(&pd)
+		model.AddPerfDataFromSpec(pd)
 	}
 }
 
@@ -149,10 +174,12 @@ func (s *System) RemoveModel(name string) error {
 	return nil
 }
 
-// Set servers from spec
+// Set servers from spec; server specs are copied into one backing array,
+// rather than each escaping to the heap on its own
 func (s *System) SetServersFromSpec(d *config.ServerData) {
-	for _, v := range d.Spec {
-		s.servers[v.Name] = NewServerFromSpec(&v)
+	specs := slices.Clone(d.Spec)
+	for i := range specs {
+		s.servers[specs[i].Name] = NewServerFromSpec(&specs[i])
 	}
 }
 
@@ -238,11 +265,8 @@ func (s *System) Capacities() map[string]int {
 
 // Get capacity of an accelerator type
 func (s *System) Capacity(name string) (int, bool) {
-	if cap, exists := s.capacity[name]; !exists {
-		return 0, false
-	} else {
-		return cap, true
-	}
+	count, exists := s.capacity[name]
+	return count, exists
 }
 
 // Remove capacity of an accelerator type
@@ -283,26 +307,24 @@ func (s *System) AllocateByType() {
 			continue
 		}
 		nameType := acc.Type()
-		var alloc *AllocationByType
-		var exists bool
-		if alloc, exists = s.allocationByType[nameType]; !exists {
+		alloc, exists := s.allocationByType[nameType]
+		if !exists {
 			alloc = &AllocationByType{
 				name:  nameType,
-				count: 0,
 				limit: s.capacity[nameType],
-				cost:  0,
 			}
+			s.allocationByType[nameType] = alloc
 		}
+		// accumulate in place through the pointer, no map write-back needed
 		alloc.count += serverAlloc.numReplicas * model.numInstances[accName] * acc.Multiplicity()
 		alloc.cost += serverAlloc.cost
-		s.allocationByType[nameType] = alloc
 	}
 }
 
 // generate json allocation solution for all servers in the system
 func (s *System) GenerateSolution() *config.AllocationSolution {
 	allocationSolution := config.AllocationSolution{
-		Spec: make(map[string]config.AllocationData),
+		Spec: make(map[string]config.AllocationData, len(s.servers)),
 	}
 	for serverName, server := range s.servers {
 		serverAlloc := server.Allocation()
@@ -310,9 +332,9 @@ func (s *System) GenerateSolution() *config.AllocationSolution {
 			continue
 		}
 		load := server.Load()
-		allocData := serverAlloc.AllocationData()
+		allocData := serverAlloc.allocationData()
 		allocData.Load = *load
-		allocationSolution.Spec[serverName] = *allocData
+		allocationSolution.Spec[serverName] = allocData
 	}
 	s.allocationSolution = &allocationSolution
 	return &allocationSolution
@@ -1459,62 +1459,106 @@ func TestSystem_GenerateSolution(t *testing.T) {
 		})
 	}
 
-	// Add server
-	system.AddServerFromSpec(config.ServerSpec{
-		Name:  "test-server",
-		Model: "test-model",
-		Class: "default",
-		CurrentAlloc: config.AllocationData{
-			Load: config.ServerLoadSpec{
-				ArrivalRate:  30,
-				AvgInTokens:  100,
-				AvgOutTokens: 200,
+	addServer := func(name string) {
+		system.AddServerFromSpec(config.ServerSpec{
+			Name:  name,
+			Model: "test-model",
+			Class: "default",
+			CurrentAlloc: config.AllocationData{
+				Load: config.ServerLoadSpec{
+					ArrivalRate:  30,
+					AvgInTokens:  100,
+					AvgOutTokens: 200,
+				},
+				Accelerator: "A100",
+				NumReplicas: 2,
 			},
-			Accelerator: "A100",
-			NumReplicas: 2,
-		},
-		MinNumReplicas: 1,
-		MaxBatchSize:   16,
-	})
-
-	// Calculate to prepare allocations
-	system.Calculate()
-
-	// Get the server and create an allocation for it
-	server := system.Server("test-server")
-	if server != nil {
-		alloc := CreateAllocation("test-server", "A100")
-		if alloc != nil {
-			server.SetAllocation(alloc)
-		}
-	}
-
-	solution := system.GenerateSolution()
-
-	if solution == nil {
-		t.Fatal("GenerateSolution should return a solution")
-	}
-
-	if system.allocationSolution != solution {
-		t.Error("System should store the generated solution")
+			MinNumReplicas: 1,
+			MaxBatchSize:   16,
+		})
 	}
 
-	// Validate solution content
-	if len(solution.Spec) == 0 {
-		t.Error("Expected solution to contain server allocations")
+	tests := []struct {
+		name        string
+		allocated   []string
+		unallocated []string
+	}{
+		{
+			name:      "single allocated server",
+			allocated: []string{"test-server"},
+		},
+		{
+			name:      "multiple allocated servers",
+			allocated: []string{"server-a", "server-b", "server-c"},
+		},
+		{
+			name:        "servers without allocation are left out",
+			allocated:   []string{"server-a"},
+			unallocated: []string{"server-b"},
+		},
 	}
 
-	// Check that the test-server is in the solution
-	serverAlloc, exists := solution.Spec["test-server"]
-	if !exists {
-		t.Error("Expected test-server to be in solution")
-	} else {
-		if serverAlloc.Accelerator == "" {
-			t.Error("Expected server allocation to have an accelerator")
-		}
-		if serverAlloc.NumReplicas <= 0 {
-			t.Errorf("Expected positive NumReplicas in solution, got %d", serverAlloc.NumReplicas)
-		}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			// servers are replaced per case, the static system data is shared
+			for name := range system.Servers() {
+				if err := system.RemoveServer(name); err != nil {
+					t.Fatalf("Failed to remove server %s: %v", name, err)
+				}
+			}
+			for _, name := range tt.allocated {
+				addServer(name)
+			}
+			for _, name := range tt.unallocated {
+				addServer(name)
+			}
+
+			// Calculate to prepare allocations
+			system.Calculate()
+
+			// create an allocation for each allocated server
+			for _, name := range tt.allocated {
+				alloc := CreateAllocation(name, "A100")
+				if alloc == nil {
+					t.Fatalf("Failed to create allocation for %s", name)
+				}
+				system.Server(name).SetAllocation(alloc)
+			}
+
+			solution := system.GenerateSolution()
+
+			if solution == nil {
+				t.Fatal("GenerateSolution should return a solution")
+			}
+
+			if system.allocationSolution != solution {
+				t.Error("System should store the generated solution")
+			}
+
+			// Validate solution content
+			if len(solution.Spec) != len(tt.allocated) {
+				t.Errorf("Expected %d server allocations in solution, got %d", len(tt.allocated), len(solution.Spec))
+			}
+
+			for _, name := range tt.allocated {
+				serverAlloc, exists := solution.Spec[name]
+				if !exists {
+					t.Errorf("Expected %s to be in solution", name)
+					continue
+				}
+				if serverAlloc.Accelerator == "" {
+					t.Error("Expected server allocation to have an accelerator")
+				}
+				if serverAlloc.NumReplicas <= 0 {
+					t.Errorf("Expected positive NumReplicas in solution, got %d", serverAlloc.NumReplicas)
+				}
+			}
+			for _, name := range tt.unallocated {
+				if _, exists := solution.Spec[name]; exists {
+					t.Errorf("Expected %s without allocation to be left out of solution", name)
+				}
+			}
+		})
 	}
 }
 
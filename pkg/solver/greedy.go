@@ -19,6 +19,47 @@ type serverEntry struct {
 	curIndex    int                // current index in allocation list
 	allocations []*core.Allocation // ordered list of allocations
 	delta       float32            // delta penalty if current allocation not allowed and next allocation is allowed
+
+	resolved   bool         // server and placements resolved
+	server     *core.Server // server, nil if server or its model not found
+	placements []placement  // placements of allocations, in the same order as allocations
+}
+
+// Placement of an allocation on accelerators
+type placement struct {
+	accType         string // type of accelerator
+	unitsPerReplica int    // number of accelerator units per replica
+	ok              bool   // accelerator found
+}
+
+// Resolve, once, the server of the entry and the placements of its (ordered) allocations,
+// returning false if the server or its model is not found
+func (e *serverEntry) resolve() bool {
+	if e.resolved {
+		return e.server != nil
+	}
+	e.resolved = true
+	server := core.GetServer(e.serverName)
+	if server == nil {
+		return false
+	}
+	model := core.GetModel(server.ModelName())
+	if model == nil {
+		return false
+	}
+	e.server = server
+	e.placements = make([]placement, len(e.allocations))
+	for i, alloc := range e.allocations {
+		gName := alloc.Accelerator()
+		if acc := core.GetAccelerator(gName); acc != nil {
+			e.placements[i] = placement{
+				accType:         acc.Type(),
+				unitsPerReplica: model.NumInstances(gName) * acc.Spec().Multiplicity,
+				ok:              true,
+			}
+		}
+	}
+	return true
 }
 
 func (e *serverEntry) String() string {
@@ -35,29 +76,39 @@ type ServerEntriesOrder func(a, b *serverEntry) int
 func (s *Solver) SolveGreedy() {
 
 	// make a copy of count of available accelerator types
-	available := make(map[string]int)
-	maps.Copy(available, core.GetCapacities())
+	capacities := core.GetCapacities()
+	available := make(map[string]int, len(capacities))
+	maps.Copy(available, capacities)
 
-	// create entries for all servers, sorting candidate allocations per server
-	entries := make([]*serverEntry, 0)
-	for serverName, server := range core.GetServers() {
+	// create entries for all servers, sorting candidate allocations per server;
+	// entries and their allocation lists are carved out of two backing arrays,
+	// rather than allocated one at a time
+	servers := core.GetServers()
+	numAllocs := 0
+	for _, server := range servers {
+		numAllocs += len(server.AllAllocations())
+	}
+	entryBlock := make([]serverEntry, 0, len(servers))
+	allocBlock := make([]*core.Allocation, 0, numAllocs)
+	entries := make([]*serverEntry, 0, len(servers))
+	for serverName, server := range servers {
 		server.RemoveAllocation()
 		allAllocs := server.AllAllocations()
 		if len(allAllocs) == 0 {
 			continue
 		}
-		e := &serverEntry{
+		start := len(allocBlock)
+		for _, alloc := range allAllocs {
+			allocBlock = append(allocBlock, alloc)
+		}
+		entryBlock = append(entryBlock, serverEntry{
 			serverName:  serverName,
 			priority:    server.Priority(),
 			curIndex:    0,
-			allocations: make([]*core.Allocation, len(allAllocs)),
+			allocations: allocBlock[start:len(allocBlock):len(allocBlock)],
 			delta:       0,
-		}
-		i := 0
-		for _, alloc := range allAllocs {
-			e.allocations[i] = alloc
-			i++
-		}
+		})
+		e := &entryBlock[len(entryBlock)-1]
 		slices.SortFunc(e.allocations, func(a, b *core.Allocation) int {
 			return cmp.Compare(a.Value(), b.Value())
 		})
@@ -71,6 +122,11 @@ func (s *Solver) SolveGreedy() {
 		entries = append(entries, e)
 	}
 
+	// shortcut: when the first choices of all servers fit together, greedy allocation would grant them all
+	if allocateFirstChoices(entries, available) {
+		return
+	}
+
 	// sorting function for server entries
 	// - straight priorities, then delta values
 	orderFunc := func(a, b *serverEntry) int {
@@ -103,6 +159,30 @@ func (s *Solver) SolveGreedy() {
 	}
 }
 
+// Allocate to all servers their first (least value) choice, if all first choices can be satisfied together;
+// returns false, without allocating, otherwise
+func allocateFirstChoices(entries []*serverEntry, available map[string]int) bool {
+	demand := make(map[string]int, len(available))
+	for _, e := range entries {
+		if !e.resolve() || !e.placements[0].ok {
+			return false
+		}
+		p := e.placements[0]
+		demand[p.accType] += e.allocations[0].NumReplicas() * p.unitsPerReplica
+	}
+	for accType, count := range demand {
+		if available[accType] < count {
+			return false
+		}
+	}
+	for _, e := range entries {
+		p := e.placements[0]
+		available[p.accType] -= e.allocations[0].NumReplicas() * p.unitsPerReplica
+		e.server.SetAllocation(e.allocations[0])
+	}
+	return true
+}
+
 // allocate, satisfying SLO requirements, returning servers that did not receive any allocation
 func allocate(entries []*serverEntry,
 	available map[string]int,
@@ -120,29 +200,20 @@ func allocate(entries []*serverEntry,
 		}
 
 		// check if current allocation in entry can be satisfied
-		serverName := top.serverName
-		server := core.GetServer(serverName)
-		if server == nil {
+		if !top.resolve() {
 			continue
 		}
-		model := core.GetModel(server.ModelName())
-		if model == nil {
+		p := top.placements[top.curIndex]
+		if !p.ok {
 			continue
 		}
 		alloc := top.allocations[top.curIndex]
-		gName := alloc.Accelerator()
-		acc := core.GetAccelerator(gName)
-		if acc == nil {
-			continue
-		}
-		tName := acc.Type()
-		unitsPerReplica := model.NumInstances(gName) * acc.Spec().Multiplicity
-		count := alloc.NumReplicas() * unitsPerReplica
+		count := alloc.NumReplicas() * p.unitsPerReplica
 
 		// check if accelerator type of current allocation is available, allocate
-		if available[tName] >= count {
-			available[tName] -= count
-			server.SetAllocation(alloc)
+		if available[p.accType] >= count {
+			available[p.accType] -= count
+			top.server.SetAllocation(alloc)
 		} else {
 			// otherwise, move to next candidate allocation
 			top.curIndex++
@@ -193,30 +264,38 @@ func bestEffort(unallocatedServers []*serverEntry, available map[string]int, pol
 //   - priority ordering: one server at a time exhaustively, until no resources to satisfy requirements
 func allocateMaximally(serverEntries []*serverEntry, available map[string]int) {
 	// fmt.Println("Unallocated server entries: ", serverEntries)
+	remaining := 0
+	for _, count := range available {
+		remaining += max(count, 0)
+	}
 	for _, entry := range serverEntries {
-		for _, alloc := range entry.allocations {
-			accName := alloc.Accelerator()
-			serverName := entry.serverName
-			server := core.GetServer(serverName)
-			model := core.GetModel(server.ModelName())
-			if acc := core.GetAccelerator(accName); acc != nil && model != nil && server != nil {
-				if unitsPerReplica := model.NumInstances(accName) * acc.Spec().Multiplicity; unitsPerReplica > 0 {
-					maxReplicas := available[acc.Type()] / unitsPerReplica
-					if maxReplicas = min(maxReplicas, alloc.NumReplicas()); maxReplicas > 0 {
-						curNumReplicas := alloc.NumReplicas()
-						// adjust cost and value
-						factor := float32(maxReplicas) / float32(curNumReplicas)
-						alloc.SetCost(alloc.Cost() * factor)
-						alloc.SetValue(alloc.Value() * factor)
-						alloc.SetNumReplicas(maxReplicas)
-						server.SetAllocation(alloc)
-						count := maxReplicas * unitsPerReplica
-						available[acc.Type()] -= count
-						// fmt.Printf("updated allocation: server=%s, acc=%s, maxReplicas=%d, type=%s, count=%d \n",
-						// 	serverName, accName, maxReplicas, acc.Type(), count)
-						break
-					}
-				}
+		// no server can receive an allocation once all accelerators are used
+		if remaining == 0 {
+			break
+		}
+		if !entry.resolve() {
+			continue
+		}
+		for i, alloc := range entry.allocations {
+			p := entry.placements[i]
+			if !p.ok || p.unitsPerReplica <= 0 {
+				continue
+			}
+			maxReplicas := available[p.accType] / p.unitsPerReplica
+			if maxReplicas = min(maxReplicas, alloc.NumReplicas()); maxReplicas > 0 {
+				curNumReplicas := alloc.NumReplicas()
+				// adjust cost and value
+				factor := float32(maxReplicas) / float32(curNumReplicas)
+				alloc.SetCost(alloc.Cost() * factor)
+				alloc.SetValue(alloc.Value() * factor)
+				alloc.SetNumReplicas(maxReplicas)
+				entry.server.SetAllocation(alloc)
+				count := maxReplicas * p.unitsPerReplica
+				available[p.accType] -= count
+				remaining -= count
+				// fmt.Printf("updated allocation: server=%s, acc=%s, maxReplicas=%d, type=%s, count=%d \n",
+				// 	entry.serverName, alloc.Accelerator(), maxReplicas, p.accType, count)
+				break
 			}
 		}
 	}
@@ -224,14 +303,12 @@ func allocateMaximally(serverEntries []*serverEntry, available map[string]int) {
 
 type serverAllocationTicket struct {
 	entry  *serverEntry
-	active bool // receiving allocation in round-robin
 	server *core.Server
-	model  *core.Model
 
 	accType         string // type of accelerator allocated to server
 	unitsPerReplica int
 	numReplicas     int
-	finalAlloc      *core.Allocation
+	finalAlloc      *core.Allocation // candidate allocation, nil until determined
 }
 
 // Allocate remaining accelerators among a group of unallocated servers
@@ -241,47 +318,38 @@ func allocateEqually(serverEntries []*serverEntry, available map[string]int) {
 
 	// create allocation tickets for all valid members in group
 	tickets := make(map[string]*serverAllocationTicket)
-	for _, serverEntry := range serverEntries {
-		serverName := serverEntry.serverName
-		server := core.GetServer(serverName)
-		model := core.GetModel(server.ModelName())
-		if model == nil || server == nil {
+	for _, entry := range serverEntries {
+		if !entry.resolve() {
 			continue
 		}
-		tickets[serverEntry.serverName] = &serverAllocationTicket{
-			entry:  serverEntry,
-			active: false,
-			server: server,
-			model:  model,
+		tickets[entry.serverName] = &serverAllocationTicket{
+			entry:  entry,
+			server: entry.server,
 		}
 	}
 
 	// visit members in round-robin way
 	allocatedTickets := make(map[string]*serverAllocationTicket)
 	for len(tickets) > 0 {
-		for _, serverEntry := range serverEntries {
-			serverName := serverEntry.serverName
+		for _, entry := range serverEntries {
+			serverName := entry.serverName
 			var ticket *serverAllocationTicket
 			if ticket = tickets[serverName]; ticket == nil {
 				continue
 			}
 			// determine candidate allocation for not yet processed members
-			if !ticket.active {
-				for _, alloc := range serverEntry.allocations {
-					accName := alloc.Accelerator()
-					if acc := core.GetAccelerator(accName); acc != nil {
-						unitsPerReplica := ticket.model.NumInstances(accName) * acc.Spec().Multiplicity
-						if unitsPerReplica > 0 && available[acc.Type()] >= unitsPerReplica {
-							ticket.active = true
-							ticket.accType = acc.Type()
-							ticket.unitsPerReplica = unitsPerReplica
-							ticket.finalAlloc = alloc
-							break
-						}
+			if ticket.finalAlloc == nil {
+				for i, alloc := range entry.allocations {
+					p := entry.placements[i]
+					if p.ok && p.unitsPerReplica > 0 && available[p.accType] >= p.unitsPerReplica {
+						ticket.accType = p.accType
+						ticket.unitsPerReplica = p.unitsPerReplica
+						ticket.finalAlloc = alloc
+						break
 					}
 				}
 				// check if no candidate allocation was found
-				if !ticket.active {
+				if ticket.finalAlloc == nil {
 					delete(tickets, serverName)
 					continue
 				}
@@ -320,22 +388,15 @@ func allocateEqually(serverEntries []*serverEntry, available map[string]int) {
 //   - groups are ordered by priority
 func makePriorityGroups(serverEntries []*serverEntry) [][]*serverEntry {
 	serverEntryGroups := make([][]*serverEntry, 0)
-	numServerEntries := len(serverEntries)
-
-	// make groups of same priority servers
-	index := 0
-	for index < numServerEntries {
-		// start new group
-		group := make([]*serverEntry, 0)
-		group = append(group, serverEntries[index])
-		groupPriority := serverEntries[index].priority
-		index++
-		for index < numServerEntries && serverEntries[index].priority == groupPriority {
-			group = append(group, serverEntries[index])
-			index++
+
+	// make groups of same priority servers in a single pass, as subslices of the (sorted) list
+	start := 0
+	for index := 1; index <= len(serverEntries); index++ {
+		if index == len(serverEntries) || serverEntries[index].priority != serverEntries[start].priority {
+			// group completed; capacity is capped so that inserting into a group never overwrites the next
+			serverEntryGroups = append(serverEntryGroups, serverEntries[start:index:index])
+			start = index
 		}
-		// group completed
-		serverEntryGroups = append(serverEntryGroups, group)
 	}
 	return serverEntryGroups
 }
@@ -2,6 +2,7 @@ package solver
 
 import (
 	"fmt"
+	"slices"
 	"strings"
 	"testing"
 
@@ -234,6 +235,44 @@ func TestServerEntry_String(t *testing.T) {
 	}
 }
 
+func TestAllocateFirstChoices(t *testing.T) {
+	setupTestSystemForGreedy()
+
+	server := core.GetServer("server1")
+	alloc := server.AllAllocations()["A100"]
+	if alloc == nil {
+		t.Fatal("Expected A100 allocation for server1")
+	}
+	count := alloc.NumReplicas() * core.GetModel("llama-7b").NumInstances("A100")
+
+	tests := []struct {
+		name      string
+		available int
+		want      bool
+	}{
+		{"first choices fit", count, true},
+		{"first choices do not fit", count - 1, false},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			server.RemoveAllocation()
+			entries := []*serverEntry{{serverName: "server1", allocations: []*core.Allocation{alloc}}}
+			available := map[string]int{"GPU_A100": tt.available}
+
+			if got := allocateFirstChoices(entries, available); got != tt.want {
+				t.Fatalf("allocateFirstChoices() = %v, want %v", got, tt.want)
+			}
+			if tt.want {
+				if server.Allocation() != alloc || available["GPU_A100"] != 0 {
+					t.Errorf("Expected first choice allocated, got %v with %d available", server.Allocation(), available["GPU_A100"])
+				}
+			} else if server.Allocation() != nil || available["GPU_A100"] != tt.available {
+				t.Errorf("Expected no allocation, got %v with %d available", server.Allocation(), available["GPU_A100"])
+			}
+		})
+	}
+}
+
 func TestSolver_SolveGreedy_NoServers(t *testing.T) {
 	// Create empty system
 	system := core.NewSystem()
@@ -388,6 +427,24 @@ func TestMakePriorityGroups_MultiplePriorities(t *testing.T) {
 	}
 }
 
+func TestMakePriorityGroups_InsertDoesNotOverwriteNextGroup(t *testing.T) {
+	entry1 := &serverEntry{serverName: "server1", priority: 1}
+	entry2 := &serverEntry{serverName: "server2", priority: 1}
+	entry3 := &serverEntry{serverName: "server3", priority: 2}
+
+	entries := []*serverEntry{entry1, entry2, entry3}
+	groups := makePriorityGroups(entries)
+
+	// allocate() pops and re-inserts entries within a group
+	group := slices.Insert(groups[0][1:], 1, entry1)
+	if len(group) != 2 || group[1] != entry1 {
+		t.Errorf("Unexpected group after insert: %v", group)
+	}
+	if groups[1][0] != entry3 || entries[2] != entry3 {
+		t.Errorf("Insert into first group overwrote next group entry, got %v", groups[1][0])
+	}
+}
+
 func TestMakePriorityGroups_OrderPreservation(t *testing.T) {
 	// Test that entries within the same priority group maintain their order
 	entry1 := &serverEntry{serverName: "server1", priority: 1}
@@ -729,6 +786,128 @@ func TestSolver_SolveGreedy_ResourceExhaustion(t *testing.T) {
 	t.Logf("Resource exhaustion test: %d/%d servers allocated with limited resources", allocatedCount, 5)
 }
 
+func TestSolver_SolveGreedy_ContendedAllocations(t *testing.T) {
+	// servers of different models and priorities competing for scarce accelerators,
+	// in addition to the servers of the test system; expected allocations are the
+	// result of the reference greedy algorithm, with "" for no allocation
+	tests := []struct {
+		name     string
+		a100     int
+		h100     int
+		servers  []config.ServerSpec
+		expected map[string]string
+	}{
+		{
+			name: "both accelerator types short",
+			a100: 2,
+			h100: 3,
+			servers: []config.ServerSpec{
+				contendedServerSpec("c0", "llama-13b", "high-priority", 102),
+				contendedServerSpec("c1", "llama-7b", "medium-priority", 18),
+				contendedServerSpec("c2", "llama-7b", "high-priority", 98),
+				contendedServerSpec("c3", "llama-13b", "high-priority", 52),
+				contendedServerSpec("c4", "llama-7b", "medium-priority", 68),
+			},
+			expected: map[string]string{
+				"server1": "A100/1", "server2": "H100/1", "server3": "",
+				"c0": "H100/1", "c1": "", "c2": "A100/1", "c3": "H100/1", "c4": "",
+			},
+		},
+		{
+			name: "high priority servers take all H100",
+			a100: 3,
+			h100: 2,
+			servers: []config.ServerSpec{
+				contendedServerSpec("c0", "llama-13b", "high-priority", 12),
+				contendedServerSpec("c1", "llama-7b", "medium-priority", 120),
+				contendedServerSpec("c2", "llama-13b", "high-priority", 100),
+				contendedServerSpec("c3", "llama-7b", "high-priority", 93),
+				contendedServerSpec("c4", "llama-7b", "high-priority", 97),
+			},
+			expected: map[string]string{
+				"server1": "A100/1", "server2": "", "server3": "",
+				"c0": "H100/1", "c1": "", "c2": "H100/1", "c3": "A100/1", "c4": "A100/1",
+			},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			setupTestSystemForGreedy()
+			core.TheSystem.SetCountFromSpec(config.AcceleratorCount{Type: "GPU_A100", Count: tt.a100})
+			core.TheSystem.SetCountFromSpec(config.AcceleratorCount{Type: "GPU_H100", Count: tt.h100})
+			for _, spec := range tt.servers {
+				core.TheSystem.AddServerFromSpec(spec)
+			}
+			core.TheSystem.Calculate()
+
+			solver := NewSolver(&config.OptimizerSpec{SaturationPolicy: "None"})
+			solver.SolveGreedy()
+
+			for serverName, want := range tt.expected {
+				server := core.GetServer(serverName)
+				if server == nil {
+					t.Fatalf("Server %s should exist", serverName)
+				}
+				got := ""
+				if alloc := server.Allocation(); alloc != nil {
+					got = fmt.Sprintf("%s/%d", alloc.Accelerator(), alloc.NumReplicas())
+				}
+				if got != want {
+					t.Errorf("%s: expected allocation %q, got %q", serverName, want, got)
+				}
+			}
+		})
+	}
+}
+
+// Spec of a server of the test system with a given arrival rate
+func contendedServerSpec(name, model, class string, arrivalRate float32) config.ServerSpec {
+	return config.ServerSpec{
+		Name:  name,
+		Model: model,
+		Class: class,
+		CurrentAlloc: config.AllocationData{
+			Load: config.ServerLoadSpec{
+				ArrivalRate:  arrivalRate,
+				AvgInTokens:  100,
+				AvgOutTokens: 200,
+			},
+		},
+		MinNumReplicas: 1,
+		MaxBatchSize:   16,
+	}
+}
+
+func TestSolver_SolveGreedy_FirstChoicesFit(t *testing.T) {
+	setupTestSystemForGreedy()
+
+	// capacity for all first choices together, so every server receives its least value allocation
+	core.TheSystem.SetCountFromSpec(config.AcceleratorCount{Type: "GPU_A100", Count: 100})
+	core.TheSystem.SetCountFromSpec(config.AcceleratorCount{Type: "GPU_H100", Count: 100})
+	core.TheSystem.AddServerFromSpec(contendedServerSpec("c0", "llama-13b", "high-priority", 102))
+	core.TheSystem.AddServerFromSpec(contendedServerSpec("c1", "llama-7b", "medium-priority", 18))
+	core.TheSystem.Calculate()
+
+	solver := NewSolver(&config.OptimizerSpec{SaturationPolicy: "None"})
+	solver.SolveGreedy()
+
+	for serverName, server := range core.GetServers() {
+		var want *core.Allocation
+		for _, alloc := range server.AllAllocations() {
+			if want == nil || alloc.Value() < want.Value() {
+				want = alloc
+			}
+		}
+		if want == nil {
+			t.Fatalf("Expected candidate allocations for %s", serverName)
+		}
+		if got := server.Allocation(); got != want {
+			t.Errorf("%s: expected first choice %v, got %v", serverName, want, got)
+		}
+	}
+}
+
 func TestSolver_SolveGreedy_HighLoadScenario(t *testing.T) {
 	setupTestSystemForGreedy()
 
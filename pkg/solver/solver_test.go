@@ -516,8 +516,9 @@ func TestSolver_SolveUnlimited_EdgeCases(t *testing.T) {
 	})
 }
 
-func TestSolver_SolveUnlimited_MinValueSelection(t *testing.T) {
-	// Create a simple system for testing minimum value selection
+// Create a fresh system with one accelerator (A100), one model (llama-7b), and a default
+// service class, holding the given server, and make it the current system
+func setupSingleServerSystem(count int, server config.ServerSpec) {
 	system := core.NewSystem()
 	system.SetFromSpec(&config.SystemSpec{
 		Accelerators: config.AcceleratorData{
@@ -546,21 +547,12 @@ func TestSolver_SolveUnlimited_MinValueSelection(t *testing.T) {
 			Count: []config.AcceleratorCount{
 				{
 					Type:  "A100",
-					Count: 2,
+					Count: count,
 				},
 			},
 		},
 		Servers: config.ServerData{
-			Spec: []config.ServerSpec{
-				{
-					Name:            "server1",
-					Class:           "default",
-					Model:           "llama-7b",
-					KeepAccelerator: true,
-					MinNumReplicas:  1,
-					MaxBatchSize:    512,
-				},
-			},
+			Spec: []config.ServerSpec{server},
 		},
 		ServiceClasses: config.ServiceClassData{
 			Spec: []config.ServiceClassSpec{
@@ -579,6 +571,18 @@ func TestSolver_SolveUnlimited_MinValueSelection(t *testing.T) {
 		},
 	})
 	core.TheSystem = system
+}
+
+func TestSolver_SolveUnlimited_MinValueSelection(t *testing.T) {
+	// Create a simple system for testing minimum value selection
+	setupSingleServerSystem(2, config.ServerSpec{
+		Name:            "server1",
+		Class:           "default",
+		Model:           "llama-7b",
+		KeepAccelerator: true,
+		MinNumReplicas:  1,
+		MaxBatchSize:    512,
+	})
 
 	optimizerSpec := &config.OptimizerSpec{
 		Unlimited:        true,
@@ -624,71 +628,18 @@ func TestSolver_SolveUnlimited_MinValueSelection(t *testing.T) {
 
 func TestSolver_String_WithDiffs(t *testing.T) {
 	// Setup system and run solve to generate allocation diffs
-	system := core.NewSystem()
-	system.SetFromSpec(&config.SystemSpec{
-		Accelerators: config.AcceleratorData{
-			Spec: []config.AcceleratorSpec{
-				{
-					Name: "A100",
-					Power: config.PowerSpec{
-						Idle:     50,
-						MidPower: 150,
-						Full:     350,
-						MidUtil:  0.4,
-					},
-				},
-			},
-		},
-		Models: config.ModelData{
-			PerfData: []config.ModelAcceleratorPerfData{
-				{
-					Name:     "llama-7b",
-					Acc:      "A100",
-					AccCount: 1,
-				},
-			},
-		},
-		Capacity: config.CapacityData{
-			Count: []config.AcceleratorCount{
-				{
-					Type:  "A100",
-					Count: 2,
-				},
-			},
-		},
-		Servers: config.ServerData{
-			Spec: []config.ServerSpec{
-				{
-					Name:            "test-server",
-					Class:           "default",
-					Model:           "llama-7b",
-					KeepAccelerator: true,
-					MinNumReplicas:  1,
-					MaxBatchSize:    512,
-					CurrentAlloc: config.AllocationData{
-						Accelerator: "A100",
-						NumReplicas: 1,
-					},
-				},
-			},
-		},
-		ServiceClasses: config.ServiceClassData{
-			Spec: []config.ServiceClassSpec{
-				{
-					Name:     "default",
-					Priority: 1,
-					ModelTargets: []config.ModelTarget{
-						{
-							Model:    "llama-7b",
-							SLO_ITL:  9,
-							SLO_TTFT: 1000,
-						},
-					},
-				},
-			},
+	setupSingleServerSystem(2, config.ServerSpec{
+		Name:            "test-server",
+		Class:           "default",
+		Model:           "llama-7b",
+		KeepAccelerator: true,
+		MinNumReplicas:  1,
+		MaxBatchSize:    512,
+		CurrentAlloc: config.AllocationData{
+			Accelerator: "A100",
+			NumReplicas: 1,
 		},
 	})
-	core.TheSystem = system
 
 	optimizerSpec := &config.OptimizerSpec{
 		Unlimited:        false,
@@ -723,67 +674,14 @@ func TestSolver_String_WithDiffs(t *testing.T) {
 // Additional tests to improve coverage of SolveUnlimited and other functions
 func TestSolver_SolveUnlimited_ValueComparison(t *testing.T) {
 	// Test the value comparison logic in SolveUnlimited
-	system := core.NewSystem()
-	system.SetFromSpec(&config.SystemSpec{
-		Accelerators: config.AcceleratorData{
-			Spec: []config.AcceleratorSpec{
-				{
-					Name: "A100",
-					Power: config.PowerSpec{
-						Idle:     50,
-						MidPower: 150,
-						Full:     350,
-						MidUtil:  0.4,
-					},
-				},
-			},
-		},
-		Models: config.ModelData{
-			PerfData: []config.ModelAcceleratorPerfData{
-				{
-					Name:     "llama-7b",
-					Acc:      "A100",
-					AccCount: 1,
-				},
-			},
-		},
-		Capacity: config.CapacityData{
-			Count: []config.AcceleratorCount{
-				{
-					Type:  "A100",
-					Count: 4,
-				},
-			},
-		},
-		Servers: config.ServerData{
-			Spec: []config.ServerSpec{
-				{
-					Name:            "test-server",
-					Class:           "default",
-					Model:           "llama-7b",
-					KeepAccelerator: true,
-					MinNumReplicas:  1,
-					MaxBatchSize:    512,
-				},
-			},
-		},
-		ServiceClasses: config.ServiceClassData{
-			Spec: []config.ServiceClassSpec{
-				{
-					Name:     "default",
-					Priority: 1,
-					ModelTargets: []config.ModelTarget{
-						{
-							Model:    "llama-7b",
-							SLO_ITL:  9,
-							SLO_TTFT: 1000,
-						},
-					},
-				},
-			},
-		},
+	setupSingleServerSystem(4, config.ServerSpec{
+		Name:            "test-server",
+		Class:           "default",
+		Model:           "llama-7b",
+		KeepAccelerator: true,
+		MinNumReplicas:  1,
+		MaxBatchSize:    512,
 	})
-	core.TheSystem = system
 
 	// Ensure server has multiple allocations with different values
 	server := core.GetServer("test-server")
@@ -26,6 +26,7 @@ import (
 	autoscalingv2 "k8s.io/api/autoscaling/v2"
 	batchv1 "k8s.io/api/batch/v1"
 	corev1 "k8s.io/api/core/v1"
+	apierrors "k8s.io/apimachinery/pkg/api/errors"
 	"k8s.io/apimachinery/pkg/api/resource"
 	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
 	"sigs.k8s.io/controller-runtime/pkg/client"
@@ -93,8 +94,11 @@ var _ = Describe("ShareGPT Scale-Up Test", Ordered, func() {
 	It("should create and run ShareGPT load generation job", func() {
 		By("cleaning up any existing job")
 		_ = k8sClient.BatchV1().Jobs(llmDNamespace).Delete(ctx, jobName, metav1.DeleteOptions{})
-		// Wait a bit for cleanup
-		time.Sleep(2 * time.Second)
+		// Wait for cleanup, returning as soon as the job is gone
+		Eventually(func(g Gomega) {
+			_, err := k8sClient.BatchV1().Jobs(llmDNamespace).Get(ctx, jobName, metav1.GetOptions{})
+			g.Expect(apierrors.IsNotFound(err)).To(BeTrue(), "Existing job should be deleted")
+		}, 30*time.Second, 200*time.Millisecond).Should(Succeed())
 
 		By("creating ShareGPT load generation job")
 		job := createShareGPTJob(jobName, llmDNamespace, requestRate, numPrompts)